@@ -284,6 +284,11 @@ DOC_INCLUDE_SYSTEM_OBJECTS=false
         else:
             self.config[section] = {key: value}
     
+    def update_many(self, updates: Dict[str, Dict[str, Any]]):
+        """Apply several configuration overrides at once, given as {section: {key: value}}."""
+        for section, values in updates.items():
+            self.config.setdefault(section, {}).update(values)
+    
     def print_config_summary(self):
         """Print a summary of current configuration."""
         print("\n=== Configuration Summary ===")
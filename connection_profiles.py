@@ -23,8 +23,24 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _read_json(path) -> Any:
+    """Read and parse a UTF-8 JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class ConnectionProfileManager:
     """Manages connection profiles and history."""
     
@@ -51,8 +67,7 @@ class ConnectionProfileManager:
             return {}
         
         try:
-            with open(self.profiles_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(self.profiles_file)
         except Exception as e:
             logger.error(f"Failed to load profiles: {e}")
             return {}
@@ -72,8 +87,7 @@ class ConnectionProfileManager:
             return []
         
         try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(self.history_file)
         except Exception as e:
             logger.error(f"Failed to load history: {e}")
             return []
@@ -325,8 +339,7 @@ class ConnectionProfileManager:
         result = {'imported': 0, 'skipped': 0, 'errors': []}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                imported_profiles = json.load(f)
+            imported_profiles = _read_json(file_path)
             
             for name, profile in imported_profiles.items():
                 try:
@@ -6,7 +6,7 @@ except ImportError:
     pyodbc = None
 
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 from azure.identity import DefaultAzureCredential, ClientSecretCredential
 import logging
 
@@ -115,6 +115,33 @@ class AzureSQLConnection:
             logger.error(f"Query execution failed: {str(e)}")
             raise
     
+    def iter_query(self, query: str, params=None, arraysize: int = 100) -> Iterator[Dict[str, Any]]:
+        """Execute a query and yield result rows as they are fetched, in batches of arraysize."""
+        if not self.cursor:
+            raise Exception("No database connection established")
+        
+        try:
+            if params is not None:
+                self.cursor.execute(query, params)
+            else:
+                self.cursor.execute(query)
+            
+            # Handle queries that don't return results
+            if self.cursor.description is None:
+                return
+            
+            columns = [column[0] for column in self.cursor.description]
+            self.cursor.arraysize = arraysize
+            while True:
+                rows = self.cursor.fetchmany(arraysize)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+        except Exception as e:
+            logger.error(f"Query execution failed: {str(e)}")
+            raise
+    
     def execute_scalar(self, query: str, params=None) -> Any:
         """Execute a query and return a single value."""
         if not self.cursor:
@@ -490,10 +490,19 @@ class CommandPalette:
     def register_command(self, name: str, description: str, callback: Callable, 
                         keywords: List[str] = None):
         """Register a command in the palette."""
+        keywords = keywords or []
+        name_lower = name.lower()
+        keywords_lower = tuple(keyword.lower() for keyword in keywords)
         self.commands[name] = {
             'description': description,
             'callback': callback,
-            'keywords': keywords or []
+            'keywords': keywords,
+            # Lower-cased once here so each keystroke is a single substring
+            # test per command; NUL keeps matches from spanning fields
+            'name_lower': name_lower,
+            'keywords_lower': keywords_lower,
+            'search_text': '\0'.join((name_lower, description.lower()) + keywords_lower),
+            'display_text': f"{name} - {description}"
         }
     
     def register_default_commands(self):
@@ -598,9 +607,9 @@ class CommandPalette:
         matching_commands.sort(key=lambda x: self.calculate_relevance(query, x[0], x[1]), reverse=True)
         
         # Add to listbox
-        for name, cmd in matching_commands[:20]:  # Limit to 20 results
-            display_text = f"{name} - {cmd['description']}"
-            self.results_listbox.insert(tk.END, display_text)
+        display_texts = [cmd['display_text'] for _, cmd in matching_commands[:20]]  # Limit to 20 results
+        if display_texts:
+            self.results_listbox.insert(tk.END, *display_texts)
         
         # Select first item
         if self.results_listbox.size() > 0:
@@ -611,26 +620,14 @@ class CommandPalette:
         if not query:
             return True
         
-        # Check name
-        if query in name.lower():
-            return True
-        
-        # Check description
-        if query in cmd['description'].lower():
-            return True
-        
-        # Check keywords
-        for keyword in cmd.get('keywords', []):
-            if query in keyword.lower():
-                return True
-        
-        return False
+        # Name, description and keywords in one pass
+        return query in cmd['search_text']
     
     def calculate_relevance(self, query: str, name: str, cmd: Dict) -> int:
         """Calculate relevance score for sorting."""
         score = 0
         query_lower = query.lower()
-        name_lower = name.lower()
+        name_lower = cmd['name_lower']
         
         # Exact name match
         if query_lower == name_lower:
@@ -643,10 +640,10 @@ class CommandPalette:
             score += 25
         
         # Keywords match
-        for keyword in cmd.get('keywords', []):
-            if query_lower == keyword.lower():
+        for keyword in cmd['keywords_lower']:
+            if query_lower == keyword:
                 score += 20
-            elif keyword.lower().startswith(query_lower):
+            elif keyword.startswith(query_lower):
                 score += 10
         
         return score
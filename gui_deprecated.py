@@ -4964,6 +4964,8 @@ class ProfileSaveDialog:
 class CompletionDialog:
     """Dialog for handling documentation generation completion with preview options."""
     
+    __slots__ = ('parent', 'gui_app', 'generated_files', 'dialog', 'files_tree')
+    
     def __init__(self, parent, gui_app, generated_files):
         self.parent = parent
         self.gui_app = gui_app
@@ -5488,6 +5490,13 @@ class GUILogHandler(logging.Handler):
 class SelectiveDocumentationDialog:
     """Dialog for selective documentation generation."""
     
+    __slots__ = (
+        'parent', 'gui_app', 'selected_objects', 'schema_data', 'result', 'dialog',
+        'objects_tree', 'output_dir', 'generate_html', 'generate_markdown', 'generate_json',
+        'include_related', 'progress_frame', 'progress_var', 'progress_bar', 'progress_label',
+        'generate_button',
+    )
+    
     def __init__(self, parent, gui_app, selected_objects, schema_data):
         self.parent = parent
         self.gui_app = gui_app
@@ -5650,6 +5659,8 @@ class SelectiveDocumentationDialog:
         """Populate the objects tree with selected objects."""
         for obj in self.selected_objects:
             obj_type = obj.get('type', self._infer_object_type(obj))
+            desc = obj.get('description', '')
+            short_desc = desc if len(desc) <= 100 else desc[:100] + '...'
             self.objects_tree.insert(
                 "",
                 "end",
@@ -5657,7 +5668,7 @@ class SelectiveDocumentationDialog:
                 values=(
                     obj_type,
                     obj.get('schema', 'dbo'),
-                    obj.get('description', '')[:100] + ('...' if len(obj.get('description', '')) > 100 else '')
+                    short_desc
                 )
             )
     
@@ -5700,19 +5711,20 @@ class SelectiveDocumentationDialog:
             messagebox.showwarning("No Selection", "Please select objects to generate documentation for.")
             return
         
-        # Validate output formats
-        if not any([self.generate_html.get(), self.generate_markdown.get(), self.generate_json.get()]):
+        # Snapshot output formats on the Tk thread; the worker only sees plain booleans
+        want = (self.generate_html.get(), self.generate_markdown.get(), self.generate_json.get())
+        if not any(want):
             messagebox.showwarning("No Format", "Please select at least one output format.")
             return
+        want_related = self.include_related.get()
         
-        # Get selected object indices
-        selected_indices = []
-        all_items = list(self.objects_tree.get_children())
-        for item in selected_items:
-            selected_indices.append(all_items.index(item))
-        
-        # Filter objects
-        objects_to_document = [self.selected_objects[i] for i in selected_indices]
+        # Filter objects (Select All -> Generate needs no index lookups)
+        children = self.objects_tree.get_children()
+        if len(selected_items) == len(children):
+            objects_to_document = list(self.selected_objects)
+        else:
+            index_by_item = {item: i for i, item in enumerate(children)}
+            objects_to_document = [self.selected_objects[index_by_item[item]] for item in selected_items]
         
         # Show progress frame
         self.progress_frame.pack(fill="x", pady=(10, 0))
@@ -5721,18 +5733,19 @@ class SelectiveDocumentationDialog:
         # Start generation in background thread
         thread = threading.Thread(
             target=self._generate_documentation_thread,
-            args=(objects_to_document,)
+            args=(objects_to_document, want, want_related)
         )
         thread.daemon = True
         thread.start()
     
-    def _generate_documentation_thread(self, objects_to_document):
+    def _generate_documentation_thread(self, objects_to_document, want, want_related):
         """Generate documentation in background thread."""
+        want_html, want_markdown, want_json = want
         try:
             self.dialog.after(0, lambda: self._update_progress(10, "Preparing documentation structure..."))
             
             # Create filtered schema data
-            filtered_schema = self._create_filtered_schema_data(objects_to_document)
+            filtered_schema = self._create_filtered_schema_data(objects_to_document, want_related)
             
             self.dialog.after(0, lambda: self._update_progress(30, "Creating documentation generator..."))
             
@@ -5746,17 +5759,17 @@ class SelectiveDocumentationDialog:
             
             generated_files = []
             
-            if self.generate_html.get():
+            if want_html:
                 self.dialog.after(0, lambda: self._update_progress(50, "Generating HTML documentation..."))
                 html_file = generator.generate_html_documentation(filtered_schema)
                 generated_files.append(('HTML', html_file))
             
-            if self.generate_markdown.get():
+            if want_markdown:
                 self.dialog.after(0, lambda: self._update_progress(70, "Generating Markdown documentation..."))
                 md_file = generator.generate_markdown_documentation(filtered_schema)
                 generated_files.append(('Markdown', md_file))
             
-            if self.generate_json.get():
+            if want_json:
                 self.dialog.after(0, lambda: self._update_progress(90, "Generating JSON documentation..."))
                 json_file = generator.generate_json_documentation(filtered_schema)
                 generated_files.append(('JSON', json_file))
@@ -5769,7 +5782,7 @@ class SelectiveDocumentationDialog:
         except Exception as e:
             self.dialog.after(0, lambda: self._handle_generation_error(str(e)))
     
-    def _create_filtered_schema_data(self, objects_to_document):
+    def _create_filtered_schema_data(self, objects_to_document, include_related):
         """Create filtered schema data containing only selected objects."""
         if not self.schema_data:
             # Create minimal schema data from objects
@@ -5818,7 +5831,7 @@ class SelectiveDocumentationDialog:
                 filtered_schema['functions'].append(obj)
         
         # Include related objects if requested
-        if self.include_related.get() and self.schema_data:
+        if include_related and self.schema_data:
             self._add_related_objects(filtered_schema, object_names)
         
         # Update statistics
@@ -5835,9 +5848,6 @@ class SelectiveDocumentationDialog:
     
     def _add_related_objects(self, filtered_schema, selected_names):
         """Add related objects based on relationships."""
-        if not self.schema_data:
-            return
-        
         # Find related tables through foreign key relationships
         related_tables = set()
         
@@ -5898,11 +5908,33 @@ class SelectiveDocumentationDialog:
 class SchemaBrowserWindow:
     """Schema browser window for exploring database objects."""
     
+    __slots__ = (
+        'parent', 'gui_app', 'database_name', 'schema_data', 'window', 'status_label',
+        'search_var', 'schema_tree', 'info_text', 'current_object',
+        '_obj_data_by_iid', '_pending_children', '_name_index', '_filter_job', '_info_sections',
+    )
+    
+    # (schema_data key, category label, tree tag)
+    SCHEMA_CATEGORIES = (
+        ('tables', 'Tables', 'table'),
+        ('views', 'Views', 'view'),
+        ('stored_procedures', 'Stored Procedures', 'procedure'),
+        ('functions', 'Functions', 'function'),
+    )
+    
+    # Marks at the start of the header, columns and definition sections of info_text
+    INFO_SECTION_MARKS = ('info_header', 'info_columns', 'info_definition')
+    
     def __init__(self, parent, gui_app, database_name):
         self.parent = parent
         self.gui_app = gui_app
         self.database_name = database_name
         self.schema_data = None
+        self._obj_data_by_iid = {}
+        self._pending_children = {}
+        self._name_index = []
+        self._filter_job = None
+        self._info_sections = ["", "", ""]
         
         # Create window
         self.window = tk.Toplevel(parent)
@@ -5960,8 +5992,19 @@ class SchemaBrowserWindow:
         tree_scroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.schema_tree.yview)
         self.schema_tree.configure(yscrollcommand=tree_scroll.set)
         
+        # Configure tags
+        self.schema_tree.tag_configure("database", foreground="blue")
+        self.schema_tree.tag_configure("category", foreground="darkblue")
+        self.schema_tree.tag_configure("table", foreground="darkgreen")
+        self.schema_tree.tag_configure("view", foreground="darkorange")
+        self.schema_tree.tag_configure("procedure", foreground="darkred")
+        self.schema_tree.tag_configure("function", foreground="darkmagenta")
+        self.schema_tree.tag_configure("column", foreground="gray")
+        self.schema_tree.tag_configure("more", foreground="lightgray", font=("TkDefaultFont", 8, "italic"))
+        
         # Bind events
         self.schema_tree.bind("<<TreeviewSelect>>", self.on_object_select)
+        self.schema_tree.bind("<<TreeviewOpen>>", self._on_tree_open)
         self.schema_tree.bind("<Double-1>", self.on_object_double_click)
         
         # Pack tree
@@ -5983,6 +6026,8 @@ class SchemaBrowserWindow:
             state="disabled"
         )
         self.info_text.pack(fill="both", expand=True)
+        for mark in self.INFO_SECTION_MARKS:
+            self.info_text.mark_set(mark, "1.0")
         
         # Action buttons
         action_frame = ttk.Frame(parent)
@@ -6039,68 +6084,32 @@ class SchemaBrowserWindow:
         thread.start()
     
     def populate_schema_tree(self):
-        """Populate the schema tree with database objects."""
+        """Populate the schema tree with database objects.
+        
+        Only the category nodes are built here; objects and columns are
+        inserted when their parent node is first expanded (see _on_tree_open).
+        """
         if not self.schema_data:
             self.status_label.config(text="No schema data available")
             return
         
         # Clear existing tree
-        for item in self.schema_tree.get_children():
-            self.schema_tree.delete(item)
+        self.schema_tree.delete(*self.schema_tree.get_children())
+        self._obj_data_by_iid = {}
+        self._pending_children = {}
+        self._name_index = []
         
         # Add database node
         db_node = self.schema_tree.insert("", "end", text=f"Database: {self.database_name}", 
                                          tags=("database",))
         
-        # Add tables
-        if 'tables' in self.schema_data and self.schema_data['tables']:
-            tables_node = self.schema_tree.insert(db_node, "end", text=f"Tables ({len(self.schema_data['tables'])})", 
-                                                 tags=("category",))
-            for table in self.schema_data['tables']:
-                table_node = self.schema_tree.insert(tables_node, "end", text=table.get('name', 'Unknown'), 
-                                                    tags=("table",), values=(table,))
-                
-                # Add columns as sub-items
-                if 'columns' in table and table['columns']:
-                    for col in table['columns'][:5]:  # Show first 5 columns
-                        col_text = f"{col.get('name', 'Unknown')} ({col.get('data_type', 'Unknown')})"
-                        self.schema_tree.insert(table_node, "end", text=col_text, tags=("column",))
-                    if len(table['columns']) > 5:
-                        self.schema_tree.insert(table_node, "end", text="... and more", tags=("more",))
-        
-        # Add views
-        if 'views' in self.schema_data and self.schema_data['views']:
-            views_node = self.schema_tree.insert(db_node, "end", text=f"Views ({len(self.schema_data['views'])})", 
-                                                tags=("category",))
-            for view in self.schema_data['views']:
-                self.schema_tree.insert(views_node, "end", text=view.get('name', 'Unknown'), 
-                                       tags=("view",), values=(view,))
-        
-        # Add procedures
-        if 'stored_procedures' in self.schema_data and self.schema_data['stored_procedures']:
-            procs_node = self.schema_tree.insert(db_node, "end", text=f"Stored Procedures ({len(self.schema_data['stored_procedures'])})", 
-                                                tags=("category",))
-            for proc in self.schema_data['stored_procedures']:
-                self.schema_tree.insert(procs_node, "end", text=proc.get('name', 'Unknown'), 
-                                       tags=("procedure",), values=(proc,))
-        
-        # Add functions
-        if 'functions' in self.schema_data and self.schema_data['functions']:
-            funcs_node = self.schema_tree.insert(db_node, "end", text=f"Functions ({len(self.schema_data['functions'])})", 
-                                                tags=("category",))
-            for func in self.schema_data['functions']:
-                self.schema_tree.insert(funcs_node, "end", text=func.get('name', 'Unknown'), 
-                                       tags=("function",), values=(func,))
-        
-        # Configure tags
-        self.schema_tree.tag_configure("database", foreground="blue")
-        self.schema_tree.tag_configure("category", foreground="darkblue")
-        self.schema_tree.tag_configure("table", foreground="darkgreen")
-        self.schema_tree.tag_configure("view", foreground="darkorange")
-        self.schema_tree.tag_configure("procedure", foreground="darkred")
-        self.schema_tree.tag_configure("function", foreground="darkmagenta")
-        self.schema_tree.tag_configure("column", foreground="gray")
-        self.schema_tree.tag_configure("more", foreground="lightgray", font=("TkDefaultFont", 8, "italic"))
+        # Add one collapsed node per object category
+        for key, label, tag in self.SCHEMA_CATEGORIES:
+            objects = self.schema_data.get(key)
+            if objects:
+                category_node = self.schema_tree.insert(db_node, "end", text=f"{label} ({len(objects)})", 
+                                                       tags=("category",))
+                self._add_placeholder(category_node, self._insert_category_objects, objects, tag)
         
         # Expand database node
         self.schema_tree.item(db_node, open=True)
@@ -6110,6 +6119,41 @@ class SchemaBrowserWindow:
                                       f"{len(self.schema_data.get('stored_procedures', []))} procedures, "
                                       f"{len(self.schema_data.get('functions', []))} functions")
     
+    def _add_placeholder(self, node, loader, *args):
+        """Give a node a dummy child so it can be expanded before it is populated."""
+        self.schema_tree.insert(node, "end", text="…", tags=("more",))
+        self._pending_children[node] = (loader, args)
+    
+    def _on_tree_open(self, event):
+        """Materialize the children of a node the first time it is expanded."""
+        node = self.schema_tree.focus()
+        pending = self._pending_children.pop(node, None)
+        if pending is None:
+            return
+        
+        loader, args = pending
+        self.schema_tree.delete(*self.schema_tree.get_children(node))
+        loader(node, *args)
+    
+    def _insert_category_objects(self, category_node, objects, tag):
+        """Insert the objects of one category under its node."""
+        for obj in objects:
+            obj_node = self.schema_tree.insert(category_node, "end", text=obj.get('name', 'Unknown'), 
+                                              tags=(tag,))
+            self._obj_data_by_iid[obj_node] = obj
+            self._name_index.append((str(obj.get('name', '')).lower(), obj_node, category_node))
+            
+            if tag == "table" and obj.get('columns'):
+                self._add_placeholder(obj_node, self._insert_table_columns, obj['columns'])
+    
+    def _insert_table_columns(self, table_node, columns):
+        """Insert a preview of a table's columns under its node."""
+        for col in columns[:5]:  # Show first 5 columns
+            col_text = f"{col.get('name', 'Unknown')} ({col.get('data_type', 'Unknown')})"
+            self.schema_tree.insert(table_node, "end", text=col_text, tags=("column",))
+        if len(columns) > 5:
+            self.schema_tree.insert(table_node, "end", text="... and more", tags=("more",))
+    
     def on_object_select(self, event):
         """Handle object selection in tree."""
         selection = self.schema_tree.selection()
@@ -6137,54 +6181,75 @@ class SchemaBrowserWindow:
     
     def get_object_data(self, item):
         """Get object data from tree item."""
-        try:
-            values = self.schema_tree.item(item)['values']
-            if values and isinstance(values[0], dict):
-                return values[0]
-        except:
-            pass
-        return None
+        return self._obj_data_by_iid.get(item)
     
     def display_object_info(self, obj_data):
         """Display basic object information."""
-        info_lines = []
-        
-        info_lines.append(f"Object Name: {obj_data.get('name', 'Unknown')}")
-        info_lines.append(f"Schema: {obj_data.get('schema', 'dbo')}")
-        info_lines.append(f"Type: {obj_data.get('type', 'Unknown')}")
+        header_lines = [
+            f"Object Name: {obj_data.get('name', 'Unknown')}",
+            f"Schema: {obj_data.get('schema', 'dbo')}",
+            f"Type: {obj_data.get('type', 'Unknown')}",
+        ]
         
         if 'row_count' in obj_data:
-            info_lines.append(f"Row Count: {obj_data['row_count']:,}")
+            header_lines.append(f"Row Count: {obj_data['row_count']:,}")
         
         if 'created_date' in obj_data:
-            info_lines.append(f"Created: {obj_data['created_date']}")
+            header_lines.append(f"Created: {obj_data['created_date']}")
         
-        if obj_data.get('description'):
-            info_lines.append(f"\nDescription:\n{obj_data['description']}")
+        description = obj_data.get('description')
+        if description:
+            header_lines.append(f"\nDescription:\n{description}")
         
+        columns_text = ""
         if 'columns' in obj_data:
-            info_lines.append(f"\nColumns ({len(obj_data['columns'])}):")
-            for col in obj_data['columns'][:10]:  # Show first 10 columns
-                nullable = "NULL" if col.get('is_nullable', True) else "NOT NULL"
-                info_lines.append(f"  • {col.get('name', 'Unknown')} - {col.get('data_type', 'Unknown')} ({nullable})")
-            if len(obj_data['columns']) > 10:
-                info_lines.append(f"  ... and {len(obj_data['columns']) - 10} more columns")
+            columns = obj_data['columns'] or []
+            column_count = len(columns)
+            column_lines = [f"\n\nColumns ({column_count}):"]
+            column_lines.extend(
+                f"  • {col.get('name', 'Unknown')} - {col.get('data_type', 'Unknown')} "
+                f"({'NULL' if col.get('is_nullable', True) else 'NOT NULL'})"
+                for col in columns[:10]  # Show first 10 columns
+            )
+            if column_count > 10:
+                column_lines.append(f"  ... and {column_count - 10} more columns")
+            columns_text = "\n".join(column_lines)
         
-        if obj_data.get('definition'):
-            definition = obj_data['definition'][:500]  # Show first 500 characters
-            if len(obj_data['definition']) > 500:
-                definition += "... (truncated)"
-            info_lines.append(f"\nDefinition:\n{definition}")
+        definition_text = ""
+        definition = obj_data.get('definition') or ''
+        if definition:
+            # Show first 500 characters
+            shown = definition if len(definition) <= 500 else definition[:500] + "... (truncated)"
+            definition_text = f"\n\nDefinition:\n{shown}"
         
         # Update display
-        self.info_text.config(state="normal")
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(1.0, "\n".join(info_lines))
-        self.info_text.config(state="disabled")
+        self._render_info_sections(("\n".join(header_lines), columns_text, definition_text))
         
         # Store current object for actions
         self.current_object = obj_data
     
+    def _render_info_sections(self, sections):
+        """Replace only the info panel sections whose text changed."""
+        marks = self.INFO_SECTION_MARKS
+        self.info_text.config(state="normal")
+        for i, new_text in enumerate(sections):
+            if new_text == self._info_sections[i]:
+                continue
+            
+            start = marks[i]
+            end = marks[i + 1] if i + 1 < len(marks) else "end-1c"
+            self.info_text.delete(start, end)
+            
+            # Keep this and earlier marks before the new text (empty sections share its
+            # position) and push later marks after it
+            for earlier in marks[:i + 1]:
+                self.info_text.mark_gravity(earlier, "left")
+            for later in marks[i + 1:]:
+                self.info_text.mark_gravity(later, "right")
+            self.info_text.insert(start, new_text)
+            self._info_sections[i] = new_text
+        self.info_text.config(state="disabled")
+    
     def view_detailed_info(self):
         """View detailed information for current object."""
         if hasattr(self, 'current_object') and self.current_object:
@@ -6210,21 +6275,52 @@ class SchemaBrowserWindow:
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
+                # 1 MiB buffer so large definitions go out in a single write
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
                     f.write(self.current_object['definition'])
                 messagebox.showinfo("Export Complete", f"Definition exported to:\n{file_path}")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export definition: {str(e)}")
     
     def filter_objects(self, event=None):
-        """Filter objects based on search text."""
-        # This would implement search filtering
-        pass
+        """Filter objects based on search text (debounced while typing)."""
+        if self._filter_job is not None:
+            self.window.after_cancel(self._filter_job)
+        self._filter_job = self.window.after(150, self._apply_filter)
+    
+    def _apply_filter(self):
+        """Detach objects whose name does not contain the search text."""
+        self._filter_job = None
+        query = self.search_var.get().strip().lower()
+        
+        # Matches may live in categories that were never expanded
+        if query:
+            for node, (loader, _) in list(self._pending_children.items()):
+                if loader == self._insert_category_objects:
+                    loader, args = self._pending_children.pop(node)
+                    self.schema_tree.delete(*self.schema_tree.get_children(node))
+                    loader(node, *args)
+        
+        if not self._name_index:
+            return
+        
+        self.schema_tree.detach(*[iid for _, iid, _ in self._name_index])
+        matched_parents = set()
+        for name, iid, parent in self._name_index:
+            if query in name:
+                self.schema_tree.reattach(iid, parent, "end")
+                matched_parents.add(parent)
+        
+        if query:
+            for parent in matched_parents:
+                self.schema_tree.item(parent, open=True)
     
     def clear_filter(self):
         """Clear search filter."""
         self.search_var.set("")
-        # Would also restore full tree view
+        if self._filter_job is not None:
+            self.window.after_cancel(self._filter_job)
+        self._apply_filter()
 
 
 def main():
@@ -9,39 +9,23 @@ This maintains backward compatibility for users who prefer the original interfac
 
 import sys
 import os
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 
+# Modules probed at startup; only their import specs are looked up, nothing is executed
+REQUIRED = ("pyodbc", "jinja2", "colorama", "click", "dotenv")
+
+# pip package names for modules whose import name differs
+PACKAGE_NAMES = {"dotenv": "python-dotenv"}
+
 def check_dependencies():
     """Check if all required dependencies are available."""
-    missing = []
-    
-    try:
-        import pyodbc
-    except ImportError:
-        missing.append("pyodbc")
-    
-    try:
-        import jinja2
-    except ImportError:
-        missing.append("jinja2")
-    
-    try:
-        import colorama
-    except ImportError:
-        missing.append("colorama")
-    
-    try:
-        import click
-    except ImportError:
-        missing.append("click")
-        
-    try:
-        from dotenv import load_dotenv
-    except ImportError:
-        missing.append("python-dotenv")
-    
-    return missing
+    return [
+        PACKAGE_NAMES.get(name, name)
+        for name in REQUIRED
+        if importlib.util.find_spec(name) is None
+    ]
 
 def main():
     """Launch the classic GUI application."""
@@ -9,55 +9,24 @@ comprehensive dependency checking, and proper error handling.
 
 import sys
 import os
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 
+# Modules probed at startup; only their import specs are looked up, nothing is executed
+REQUIRED = ("pyodbc", "jinja2", "colorama", "click", "dotenv")
+MODERN = ("matplotlib", "pandas", "numpy")
+
+# pip package names for modules whose import name differs
+PACKAGE_NAMES = {"dotenv": "python-dotenv"}
+
 def check_dependencies():
     """Check if all required dependencies are available."""
-    missing = []
-    
-    try:
-        import pyodbc
-    except ImportError:
-        missing.append("pyodbc")
-    
-    try:
-        import jinja2
-    except ImportError:
-        missing.append("jinja2")
-    
-    try:
-        import colorama
-    except ImportError:
-        missing.append("colorama")
-    
-    try:
-        import click
-    except ImportError:
-        missing.append("click")
-        
-    try:
-        from dotenv import load_dotenv
-    except ImportError:
-        missing.append("python-dotenv")
-    
-    # Check modern GUI specific dependencies
-    try:
-        import matplotlib
-    except ImportError:
-        missing.append("matplotlib")
-        
-    try:
-        import pandas
-    except ImportError:
-        missing.append("pandas")
-        
-    try:
-        import numpy
-    except ImportError:
-        missing.append("numpy")
-    
-    return missing
+    return [
+        PACKAGE_NAMES.get(name, name)
+        for name in REQUIRED + MODERN
+        if importlib.util.find_spec(name) is None
+    ]
 
 def main():
     """Launch the GUI application."""
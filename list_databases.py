@@ -44,25 +44,28 @@ def list_databases():
             ORDER BY name
             """
             
-            databases = db.execute_query(query)
-            
-            if databases:
-                print(f"\n{Fore.CYAN}Available Databases:{Style.RESET_ALL}")
-                print("-" * 80)
-                print(f"{'Database Name':<30} {'Created':<20} {'Status':<15} {'Collation'}")
-                print("-" * 80)
-                
-                for db_info in databases:
-                    create_date = db_info['create_date'].strftime('%Y-%m-%d %H:%M:%S') if db_info['create_date'] else 'Unknown'
-                    print(f"{db_info['database_name']:<30} {create_date:<20} {db_info['status']:<15} {db_info['collation_name']}")
+            # Print rows as they arrive instead of waiting for the full result set
+            count = 0
+            recommended = None
+            for db_info in db.iter_query(query):
+                if count == 0:
+                    print(f"\n{Fore.CYAN}Available Databases:{Style.RESET_ALL}")
+                    print("-" * 80)
+                    print(f"{'Database Name':<30} {'Created':<20} {'Status':<15} {'Collation'}")
+                    print("-" * 80)
                 
-                print(f"\n{Fore.YELLOW}Found {len(databases)} user database(s){Style.RESET_ALL}")
+                create_date = db_info['create_date'].strftime('%Y-%m-%d %H:%M:%S') if db_info['create_date'] else 'Unknown'
+                print(f"{db_info['database_name']:<30} {create_date:<20} {db_info['status']:<15} {db_info['collation_name']}")
+                count += 1
+                recommended = db_info['database_name']
+            
+            if count:
+                print(f"\n{Fore.YELLOW}Found {count} user database(s){Style.RESET_ALL}")
                 
                 # If there's only one database, suggest using it
-                if len(databases) == 1:
-                    db_name = databases[0]['database_name']
-                    print(f"\n{Fore.GREEN}Recommendation: Use database '{db_name}' for documentation{Style.RESET_ALL}")
-                    return db_name
+                if count == 1:
+                    print(f"\n{Fore.GREEN}Recommendation: Use database '{recommended}' for documentation{Style.RESET_ALL}")
+                    return recommended
                 else:
                     print(f"\n{Fore.YELLOW}Please specify which database you want to document{Style.RESET_ALL}")
                     return None
@@ -41,10 +41,6 @@ import click
 # Initialize colorama for Windows
 init()
 
-from db_connection import AzureSQLConnection
-from schema_analyzer import SchemaAnalyzer
-from documentation_extractor import DocumentationExtractor
-from documentation_generator import DocumentationGenerator
 from config_manager import ConfigManager
 
 def setup_logging(config_manager: ConfigManager):
@@ -64,26 +60,30 @@ def setup_logging(config_manager: ConfigManager):
     if not os.path.dirname(log_file):
         log_file = os.path.join('logs', log_file)
     
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # One formatter shared by both handlers; the log file is only opened on first write
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(log_file, encoding='utf-8', delay=True),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    logging.basicConfig(level=log_level, handlers=handlers)
 
-def print_banner():
-    """Print application banner."""
-    banner = f"""
+BANNER = f"""
 {Fore.CYAN}============================================================
       Azure SQL Database Documentation Generator
                                                               
   Comprehensive database documentation tool for Azure SQL    
   Supports multiple authentication methods and output formats 
 ============================================================{Style.RESET_ALL}
+
 """
-    print(banner)
+
+def print_banner():
+    """Print application banner."""
+    sys.stdout.write(BANNER)
 
 def validate_requirements():
     """Validate that required dependencies are installed."""
@@ -133,32 +133,31 @@ def main(config, html_only, markdown_only, json_only, output_dir, create_samples
             print(f"{Fore.RED}- Failed to create sample files: {str(e)}{Style.RESET_ALL}")
             sys.exit(1)
     
-    # Setup logging
+    # Collect command-line overrides and apply them in one batch
+    overrides = {}
     if verbose:
-        config_manager.update_config('logging', 'level', 'DEBUG')
+        overrides['logging'] = {'level': 'DEBUG'}
     elif quiet:
-        config_manager.update_config('logging', 'level', 'ERROR')
+        overrides['logging'] = {'level': 'ERROR'}
     
-    setup_logging(config_manager)
-    logger = logging.getLogger(__name__)
-    
-    # Override output directory if specified
+    doc_overrides = {}
     if output_dir:
-        config_manager.update_config('documentation', 'output_directory', output_dir)
-    
-    # Override output format flags
+        doc_overrides['output_directory'] = output_dir
     if html_only:
-        config_manager.update_config('documentation', 'generate_html', True)
-        config_manager.update_config('documentation', 'generate_markdown', False)
-        config_manager.update_config('documentation', 'generate_json', False)
+        doc_overrides.update(generate_html=True, generate_markdown=False, generate_json=False)
     elif markdown_only:
-        config_manager.update_config('documentation', 'generate_html', False)
-        config_manager.update_config('documentation', 'generate_markdown', True)
-        config_manager.update_config('documentation', 'generate_json', False)
+        doc_overrides.update(generate_html=False, generate_markdown=True, generate_json=False)
     elif json_only:
-        config_manager.update_config('documentation', 'generate_html', False)
-        config_manager.update_config('documentation', 'generate_markdown', False)
-        config_manager.update_config('documentation', 'generate_json', True)
+        doc_overrides.update(generate_html=False, generate_markdown=False, generate_json=True)
+    if doc_overrides:
+        overrides['documentation'] = doc_overrides
+    
+    if overrides:
+        config_manager.update_many(overrides)
+    
+    # Setup logging
+    setup_logging(config_manager)
+    logger = logging.getLogger(__name__)
     
     # Print configuration summary
     if not quiet:
@@ -178,6 +177,9 @@ def main(config, html_only, markdown_only, json_only, output_dir, create_samples
     # Get connection parameters
     connection_params = config_manager.get_connection_params()
     
+    # Deferred so --help, --create-samples and config errors skip the pyodbc/azure imports
+    from db_connection import AzureSQLConnection
+    
     try:
         # Establish database connection
         print(f"{Fore.YELLOW}Connecting to database...{Style.RESET_ALL}")
@@ -237,6 +239,7 @@ def main(config, html_only, markdown_only, json_only, output_dir, create_samples
             # Extract documentation
             print(f"\n{Fore.YELLOW}Extracting database schema and metadata...{Style.RESET_ALL}")
             
+            from documentation_extractor import DocumentationExtractor
             extractor = DocumentationExtractor(db)
             documentation = extractor.extract_complete_documentation()
             
@@ -253,6 +256,7 @@ def main(config, html_only, markdown_only, json_only, output_dir, create_samples
             doc_config = config_manager.get_documentation_config()
             output_directory = doc_config.get('output_directory', 'output')
             
+            from documentation_generator import DocumentationGenerator
             generator = DocumentationGenerator(output_directory)
             
             generated_files = []
@@ -270,13 +274,10 @@ def main(config, html_only, markdown_only, json_only, output_dir, create_samples
                 generated_files.append(('JSON', json_file))
             
             # Success message
-            print(f"\n{Fore.GREEN}+ Documentation generation completed{Style.RESET_ALL}")
-            print(f"\nGenerated files:")
-            for format_type, file_path in generated_files:
-                abs_path = os.path.abspath(file_path)
-                print(f"  {format_type}: {abs_path}")
-            
-            print(f"\n{Fore.CYAN}Documentation generated successfully!{Style.RESET_ALL}")
+            lines = [f"\n{Fore.GREEN}+ Documentation generation completed{Style.RESET_ALL}", "\nGenerated files:"]
+            lines.extend(f"  {format_type}: {os.path.abspath(file_path)}" for format_type, file_path in generated_files)
+            lines.append(f"\n{Fore.CYAN}Documentation generated successfully!{Style.RESET_ALL}")
+            sys.stdout.write("\n".join(lines) + "\n")
             
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Operation cancelled by user{Style.RESET_ALL}")
@@ -17,29 +17,118 @@ Features:
 - Risk assessment and impact analysis
 """
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 import sqlite3
 import json
+import hashlib
 import os
+import io
+import copy
+import heapq
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Set
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, scrolledtext
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, Set, TYPE_CHECKING
 from collections import defaultdict, OrderedDict
+from itertools import chain
+from operator import itemgetter
 import re
 
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog, scrolledtext
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(text):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """Key-sorted JSON bytes for fingerprinting."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+def _import_tk():
+    """Import tkinter on first GUI use so headless callers never load Tk."""
+    global tk, ttk, messagebox, filedialog, scrolledtext
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog, scrolledtext
+
+
+# Character types whose max_length is rendered as TYPE(n)
+_LENGTH_TYPES = frozenset({'VARCHAR', 'NVARCHAR', 'CHAR', 'NCHAR'})
+
+# Statement keywords checked for a terminating semicolon
+_STATEMENT_KEYWORDS = ('CREATE ', 'DROP ', 'ALTER ')
+
+# Lines opening a CREATE/DROP/ALTER statement, without surrounding whitespace
+_STATEMENT_LINE_RE = re.compile(r'^[^\S\n]*((?:CREATE|DROP|ALTER) [^\n]*?\S)[^\S\n]*$',
+                                re.IGNORECASE | re.MULTILINE)
+
+# Runs of characters not kept in exported file names (some are illegal on Windows)
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-]+')
+
 
 class MigrationDatabase:
     """Manages migration history and tracking database."""
     
+    # Explicit column list for plan reads, in table order
+    PLAN_COLUMNS = ("id, name, source_database, target_database, created_timestamp, updated_timestamp, "
+                    "status, description, migration_data, risk_level, estimated_duration, dependencies")
+    
     def __init__(self, db_path: str = "migrations.db"):
         self.db_path = Path(db_path)
+        # One shared connection; the lock serializes access from GUI and worker threads
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        # Parsed plans keyed by id -> (updated_timestamp, plan)
+        self._plan_cache: Dict[int, Tuple[str, Dict]] = {}
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection pragmas applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            # Refresh planner statistics for the indexes before letting go
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+    
     def _init_database(self):
         """Initialize the migration database with required tables."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._lock, self._conn as conn:
+            # WAL is persistent: one fsync per commit and readers don't block the writer
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
             # Migration plans
@@ -92,16 +181,16 @@ class MigrationDatabase:
                 )
             """)
             
-            conn.commit()
-        finally:
-            conn.close()
+            # The plan list is ordered by update time; history is looked up per plan
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_plans_updated ON migration_plans (updated_timestamp DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_exec_plan ON migration_executions (plan_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_val_plan ON migration_validations (plan_id)")
     
     def save_migration_plan(self, name: str, source_db: str, target_db: str, 
                            description: str, migration_data: Dict, risk_level: str,
                            estimated_duration: int, dependencies: List[str]) -> int:
         """Save a migration plan."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             
             # Check if plan exists
@@ -116,8 +205,8 @@ class MigrationDatabase:
                         migration_data = ?, risk_level = ?, estimated_duration = ?,
                         dependencies = ?, updated_timestamp = CURRENT_TIMESTAMP
                     WHERE name = ?
-                """, (source_db, target_db, description, json.dumps(migration_data),
-                     risk_level, estimated_duration, json.dumps(dependencies), name))
+                """, (source_db, target_db, description, _json_dumps(migration_data),
+                     risk_level, estimated_duration, _json_dumps(dependencies), name))
                 plan_id = existing[0]
             else:
                 # Create new plan
@@ -126,40 +215,81 @@ class MigrationDatabase:
                     (name, source_database, target_database, description, migration_data,
                      risk_level, estimated_duration, dependencies)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (name, source_db, target_db, description, json.dumps(migration_data),
-                     risk_level, estimated_duration, json.dumps(dependencies)))
+                """, (name, source_db, target_db, description, _json_dumps(migration_data),
+                     risk_level, estimated_duration, _json_dumps(dependencies)))
                 plan_id = cursor.lastrowid
             
-            conn.commit()
+            # Timestamps only have second resolution, so drop the entry explicitly
+            self._plan_cache.pop(plan_id, None)
             return plan_id
-        finally:
-            conn.close()
+    
+    def save_migration_plans_bulk(self, plans: List[Dict]):
+        """Save several migration plans in one transaction.
+        
+        Each plan is a dict with the keyword arguments of save_migration_plan;
+        plans whose name already exists are updated in place.
+        """
+        rows = [(plan['name'], plan['source_db'], plan['target_db'], plan['description'],
+                 _json_dumps(plan['migration_data']), plan['risk_level'],
+                 plan['estimated_duration'], _json_dumps(plan['dependencies']))
+                for plan in plans]
+        
+        with self._lock, self._conn as conn:
+            conn.executemany("""
+                INSERT INTO migration_plans 
+                (name, source_database, target_database, description, migration_data,
+                 risk_level, estimated_duration, dependencies)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET 
+                    source_database = excluded.source_database, target_database = excluded.target_database,
+                    description = excluded.description, migration_data = excluded.migration_data,
+                    risk_level = excluded.risk_level, estimated_duration = excluded.estimated_duration,
+                    dependencies = excluded.dependencies, updated_timestamp = CURRENT_TIMESTAMP
+            """, rows)
+            
+            # Updated plans may keep their timestamp within the same second
+            self._plan_cache.clear()
     
     def get_migration_plans(self) -> List[Dict]:
         """Get all migration plans."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT * FROM migration_plans ORDER BY updated_timestamp DESC
+                SELECT id, updated_timestamp FROM migration_plans ORDER BY updated_timestamp DESC
             """)
+            keys = cursor.fetchall()
+            
+            # Only fetch and parse rows that are new or changed since the last call
+            stale = [plan_id for plan_id, updated in keys
+                     if self._plan_cache.get(plan_id, (None,))[0] != updated]
+            if stale:
+                placeholders = ','.join('?' * len(stale))
+                cursor.execute(f"""
+                    SELECT {self.PLAN_COLUMNS} FROM migration_plans WHERE id IN ({placeholders})
+                """, stale)
+                for row in cursor.fetchall():
+                    plan = dict(row)
+                    plan['migration_data'] = _json_loads(plan['migration_data']) if plan['migration_data'] else {}
+                    plan['dependencies'] = _json_loads(plan['dependencies']) if plan['dependencies'] else []
+                    self._plan_cache[plan['id']] = (plan['updated_timestamp'], plan)
             
-            columns = [desc[0] for desc in cursor.description]
-            plans = []
-            for row in cursor.fetchall():
-                plan = dict(zip(columns, row))
-                plan['migration_data'] = json.loads(plan['migration_data']) if plan['migration_data'] else {}
-                plan['dependencies'] = json.loads(plan['dependencies']) if plan['dependencies'] else []
-                plans.append(plan)
-            return plans
-        finally:
-            conn.close()
+            live = {plan_id for plan_id, _ in keys}
+            for plan_id in self._plan_cache.keys() - live:
+                del self._plan_cache[plan_id]
+            
+            # Callers get their own copies so editing a plan cannot corrupt the cache
+            return [self._copy_plan(self._plan_cache[plan_id][1]) for plan_id, _ in keys]
+    
+    @staticmethod
+    def _copy_plan(plan: Dict) -> Dict:
+        """Copy a cached plan, including its parsed JSON fields."""
+        return dict(plan, migration_data=copy.deepcopy(plan['migration_data']),
+                    dependencies=copy.deepcopy(plan['dependencies']))
     
     def log_migration_execution(self, plan_id: int, status: str, executed_by: str,
                               execution_log: str = None) -> int:
         """Log migration execution."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO migration_executions 
@@ -167,11 +297,135 @@ class MigrationDatabase:
                 VALUES (?, ?, ?, CURRENT_TIMESTAMP, ?)
             """, (plan_id, status, executed_by, execution_log))
             
-            execution_id = cursor.lastrowid
-            conn.commit()
-            return execution_id
-        finally:
-            conn.close()
+            return cursor.lastrowid
+    
+    def log_executions_batch(self, rows: List[Tuple]):
+        """Log several executions in one transaction.
+        
+        Each row is (plan_id, status, executed_by, execution_log).
+        """
+        with self._lock, self._conn as conn:
+            conn.executemany("""
+                INSERT INTO migration_executions 
+                (plan_id, status, executed_by, start_time, execution_log)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP, ?)
+            """, rows)
+    
+    def log_validations_batch(self, plan_id: int, results: List[Dict]):
+        """Record a plan's validation results in one transaction."""
+        with self._lock, self._conn as conn:
+            conn.executemany("""
+                INSERT INTO migration_validations 
+                (plan_id, validation_type, status, message, details)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(plan_id, r['type'], r['status'], r['message'], _json_dumps(r.get('details', {})))
+                  for r in results])
+
+
+def _preview(text: str, limit: int = 100) -> str:
+    """Shorten text for a tree view cell, marking it when truncated."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+# Slice size for exporting scripts to disk
+_SCRIPT_WRITE_CHUNK = 1 << 20
+
+
+def _write_script_file(path: str, script: str):
+    """Write a script as UTF-8 straight to the file descriptor, one slice at a time."""
+    # Encoding each slice ourselves skips TextIOWrapper and keeps the bytes to one chunk
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)  # umask applies, as with open()
+    try:
+        for start in range(0, len(script), _SCRIPT_WRITE_CHUNK):
+            chunk = script[start:start + _SCRIPT_WRITE_CHUNK]
+            if os.linesep != '\n':
+                # Match the line endings text mode would have written
+                chunk = chunk.replace('\n', os.linesep)
+            data = memoryview(chunk.encode('utf-8'))
+            while data:
+                data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# Column fields whose values repeat across a schema (names, types, 'YES'/'NO')
+_INTERNED_COLUMN_FIELDS = ('column_name', 'data_type', 'is_nullable')
+
+
+def _intern_schema(schema: Dict) -> Dict:
+    """Intern repeated column strings in place so equal values share one object."""
+    intern = sys.intern
+    for table in schema.get('tables', ()):
+        for column in table.get('columns', ()):
+            for field in _INTERNED_COLUMN_FIELDS:
+                value = column.get(field)
+                if type(value) is str:
+                    column[field] = intern(value)
+    return schema
+
+
+def _split_names(source: Dict, target: Dict) -> Tuple[List[str], List[str], List[str]]:
+    """Split object names into (created, dropped, common), keeping schema order."""
+    created = target.keys() - source.keys()
+    dropped = source.keys() - target.keys()
+    return (
+        [name for name in target if name in created] if created else [],
+        [name for name in source if name in dropped] if dropped else [],
+        [name for name in source if name not in dropped] if dropped else list(source)
+    )
+
+
+def _column_key(column: Dict) -> Tuple:
+    """Tuple of the attributes compared when diffing a column."""
+    get = column.get
+    return (get('data_type'), get('max_length'), get('precision'),
+            get('scale'), get('is_nullable'), get('default_value'))
+
+
+@dataclass
+class SchemaIndex:
+    """Name-keyed lookups over a schema dict, built once per schema."""
+    __slots__ = ('tables', 'columns', 'views', 'procedures', 'functions', 'indexes', 'fingerprint')
+    tables: Dict[str, Dict]
+    columns: Dict[str, Dict[str, Dict]]  # table name -> column name -> column
+    views: Dict[str, Dict]
+    procedures: Dict[str, Dict]
+    functions: Dict[str, Dict]
+    indexes: Dict[str, Dict]
+    fingerprint: str  # content hash of the source dict
+    
+    @staticmethod
+    def fingerprint_of(schema: Dict) -> str:
+        """Content hash of a schema dict."""
+        return hashlib.blake2b(_canonical_json(schema), digest_size=16).hexdigest()
+    
+    @classmethod
+    def from_dict(cls, schema: Dict, fingerprint: Optional[str] = None) -> 'SchemaIndex':
+        """Index a schema dict as produced by the documentation extractor."""
+        table_list = schema.get('tables', ())
+        
+        # Tables and their column lookups in a single pass over the table list
+        tables = {}
+        columns = {}
+        for table in table_list:
+            table_name = table['table_name']
+            tables[table_name] = table
+            columns[table_name] = {c['column_name']: c for c in table.get('columns', ())}
+        
+        indexes = {index['index_name']: index
+                   for index in chain.from_iterable(t.get('indexes', ()) for t in table_list)
+                   if index.get('index_name')}
+        
+        return cls(
+            tables=tables,
+            columns=columns,
+            views={v['view_name']: v for v in schema.get('views', ())},
+            procedures={r['routine_name']: r for r in schema.get('stored_procedures', ())},
+            functions={r['routine_name']: r for r in schema.get('functions', ())},
+            indexes=indexes,
+            fingerprint=fingerprint or cls.fingerprint_of(schema)
+        )
 
 
 class SchemaAnalyzer:
@@ -187,127 +441,164 @@ class SchemaAnalyzer:
             'CREATE_PROCEDURE', 'DROP_PROCEDURE', 'ALTER_PROCEDURE',
             'CREATE_FUNCTION', 'DROP_FUNCTION', 'ALTER_FUNCTION'
         }
+        self._index_cache: Dict[str, SchemaIndex] = {}
+        self._diff_cache: OrderedDict = OrderedDict()
     
-    def analyze_schema_differences(self, source_schema: Dict, target_schema: Dict) -> Dict[str, List]:
-        """Analyze differences between source and target schemas."""
-        differences = {
-            'tables': self._analyze_table_differences(source_schema, target_schema),
-            'views': self._analyze_view_differences(source_schema, target_schema),
-            'procedures': self._analyze_procedure_differences(source_schema, target_schema),
-            'functions': self._analyze_function_differences(source_schema, target_schema),
-            'indexes': self._analyze_index_differences(source_schema, target_schema)
-        }
-        
-        return differences
+    # (create, drop, alter) operation names per routine type; literals, so interned once
+    ROUTINE_OPERATIONS = {
+        'PROCEDURE': ('CREATE_PROCEDURE', 'DROP_PROCEDURE', 'ALTER_PROCEDURE'),
+        'FUNCTION': ('CREATE_FUNCTION', 'DROP_FUNCTION', 'ALTER_FUNCTION')
+    }
     
-    def _analyze_table_differences(self, source_schema: Dict, target_schema: Dict) -> List[Dict]:
+    # Number of indexed schemas kept by _index_for
+    INDEX_CACHE_SIZE = 8
+    # Number of (source, target) comparisons kept by analyze_schema_differences
+    DIFF_CACHE_SIZE = 32
+    
+    def analyze_schema_differences(self, source_schema, target_schema) -> Dict[str, List]:
+        """Analyze differences between source and target schemas.
+        
+        Either argument may be a schema dict or a prebuilt SchemaIndex.
+        """
+        source = self._index_for(source_schema)
+        target = self._index_for(target_schema)
+        
+        # Keyed by content, so reloading a changed schema file misses naturally
+        key = (source.fingerprint, target.fingerprint)
+        differences = self._diff_cache.get(key)
+        if differences is None:
+            differences = {
+                'tables': self._analyze_table_differences(source, target),
+                'views': self._analyze_view_differences(source, target),
+                'procedures': self._analyze_procedure_differences(source, target),
+                'functions': self._analyze_function_differences(source, target),
+                'indexes': self._analyze_index_differences(source, target)
+            }
+            # The operations hold the schemas' own dicts, so cache a private copy
+            self._diff_cache[key] = copy.deepcopy(differences)
+            if len(self._diff_cache) > self.DIFF_CACHE_SIZE:
+                self._diff_cache.popitem(last=False)
+            return differences
+        
+        self._diff_cache.move_to_end(key)
+        # Callers get their own operations so editing them can't modify the cached result
+        return copy.deepcopy(differences)
+    
+    def _index_for(self, schema) -> SchemaIndex:
+        """Return the SchemaIndex for a schema, reusing one built for the same content."""
+        if isinstance(schema, SchemaIndex):
+            return schema
+        
+        # Keyed by content, so a schema dict edited in place is indexed again
+        fingerprint = SchemaIndex.fingerprint_of(schema)
+        index = self._index_cache.get(fingerprint)
+        if index is not None:
+            return index
+        
+        index = SchemaIndex.from_dict(schema, fingerprint)
+        if len(self._index_cache) >= self.INDEX_CACHE_SIZE:
+            del self._index_cache[next(iter(self._index_cache))]
+        self._index_cache[fingerprint] = index
+        return index
+    
+    def _analyze_table_differences(self, source: SchemaIndex, target: SchemaIndex) -> List[Dict]:
         """Analyze table differences."""
         differences = []
         
-        source_tables = {t['table_name']: t for t in source_schema.get('tables', [])}
-        target_tables = {t['table_name']: t for t in target_schema.get('tables', [])}
+        source_tables = source.tables
+        target_tables = target.tables
+        
+        created, dropped, common = _split_names(source_tables, target_tables)
         
         # Tables only in target (need to create)
-        for table_name in target_tables:
-            if table_name not in source_tables:
-                differences.append({
-                    'operation': 'CREATE_TABLE',
-                    'object_name': table_name,
-                    'object_type': 'TABLE',
-                    'details': target_tables[table_name],
-                    'risk_level': 'low',
-                    'rollback_operation': 'DROP_TABLE'
-                })
+        for table_name in created:
+            differences.append({
+                'operation': 'CREATE_TABLE',
+                'object_name': table_name,
+                'object_type': 'TABLE',
+                'details': target_tables[table_name],
+                'risk_level': 'low',
+                'rollback_operation': 'DROP_TABLE'
+            })
         
         # Tables only in source (need to drop)
-        for table_name in source_tables:
-            if table_name not in target_tables:
-                differences.append({
-                    'operation': 'DROP_TABLE',
-                    'object_name': table_name,
-                    'object_type': 'TABLE',
-                    'details': source_tables[table_name],
-                    'risk_level': 'high',
-                    'rollback_operation': 'CREATE_TABLE'
-                })
+        for table_name in dropped:
+            differences.append({
+                'operation': 'DROP_TABLE',
+                'object_name': table_name,
+                'object_type': 'TABLE',
+                'details': source_tables[table_name],
+                'risk_level': 'high',
+                'rollback_operation': 'CREATE_TABLE'
+            })
         
         # Tables in both (need to compare structure)
-        for table_name in source_tables:
-            if table_name in target_tables:
-                table_diffs = self._analyze_table_structure_differences(
-                    source_tables[table_name], target_tables[table_name]
-                )
-                differences.extend(table_diffs)
+        for table_name in common:
+            table_diffs = self._analyze_table_structure_differences(
+                table_name, source.columns[table_name], target.columns[table_name]
+            )
+            differences.extend(table_diffs)
         
         return differences
     
-    def _analyze_table_structure_differences(self, source_table: Dict, target_table: Dict) -> List[Dict]:
+    def _analyze_table_structure_differences(self, table_name: str, source_columns: Dict[str, Dict],
+                                             target_columns: Dict[str, Dict]) -> List[Dict]:
         """Analyze differences in table structure."""
         differences = []
-        table_name = target_table['table_name']
         
-        source_columns = {c['column_name']: c for c in source_table.get('columns', [])}
-        target_columns = {c['column_name']: c for c in target_table.get('columns', [])}
+        created, dropped, common = _split_names(source_columns, target_columns)
         
         # Columns to add
-        for col_name in target_columns:
-            if col_name not in source_columns:
-                differences.append({
-                    'operation': 'ADD_COLUMN',
-                    'object_name': f"{table_name}.{col_name}",
-                    'object_type': 'COLUMN',
-                    'details': {
-                        'table': table_name,
-                        'column': target_columns[col_name]
-                    },
-                    'risk_level': self._assess_column_add_risk(target_columns[col_name]),
-                    'rollback_operation': 'DROP_COLUMN'
-                })
+        for col_name in created:
+            differences.append({
+                'operation': 'ADD_COLUMN',
+                'object_name': f"{table_name}.{col_name}",
+                'object_type': 'COLUMN',
+                'details': {
+                    'table': table_name,
+                    'column': target_columns[col_name]
+                },
+                'risk_level': self._assess_column_add_risk(target_columns[col_name]),
+                'rollback_operation': 'DROP_COLUMN'
+            })
         
         # Columns to drop
-        for col_name in source_columns:
-            if col_name not in target_columns:
+        for col_name in dropped:
+            differences.append({
+                'operation': 'DROP_COLUMN',
+                'object_name': f"{table_name}.{col_name}",
+                'object_type': 'COLUMN',
+                'details': {
+                    'table': table_name,
+                    'column': source_columns[col_name]
+                },
+                'risk_level': 'high',
+                'rollback_operation': 'ADD_COLUMN'
+            })
+        
+        # Columns to alter
+        for col_name in common:
+            if self._columns_differ(source_columns[col_name], target_columns[col_name]):
                 differences.append({
-                    'operation': 'DROP_COLUMN',
+                    'operation': 'ALTER_COLUMN',
                     'object_name': f"{table_name}.{col_name}",
                     'object_type': 'COLUMN',
                     'details': {
                         'table': table_name,
-                        'column': source_columns[col_name]
+                        'source_column': source_columns[col_name],
+                        'target_column': target_columns[col_name]
                     },
-                    'risk_level': 'high',
-                    'rollback_operation': 'ADD_COLUMN'
+                    'risk_level': self._assess_column_alter_risk(
+                        source_columns[col_name], target_columns[col_name]
+                    ),
+                    'rollback_operation': 'ALTER_COLUMN'
                 })
         
-        # Columns to alter
-        for col_name in source_columns:
-            if col_name in target_columns:
-                if self._columns_differ(source_columns[col_name], target_columns[col_name]):
-                    differences.append({
-                        'operation': 'ALTER_COLUMN',
-                        'object_name': f"{table_name}.{col_name}",
-                        'object_type': 'COLUMN',
-                        'details': {
-                            'table': table_name,
-                            'source_column': source_columns[col_name],
-                            'target_column': target_columns[col_name]
-                        },
-                        'risk_level': self._assess_column_alter_risk(
-                            source_columns[col_name], target_columns[col_name]
-                        ),
-                        'rollback_operation': 'ALTER_COLUMN'
-                    })
-        
         return differences
     
     def _columns_differ(self, source_col: Dict, target_col: Dict) -> bool:
         """Check if two columns have differences."""
-        compare_fields = ['data_type', 'max_length', 'precision', 'scale', 'is_nullable', 'default_value']
-        
-        for field in compare_fields:
-            if source_col.get(field) != target_col.get(field):
-                return True
-        return False
+        return _column_key(source_col) != _column_key(target_col)
     
     def _assess_column_add_risk(self, column: Dict) -> str:
         """Assess risk level for adding a column."""
@@ -332,163 +623,138 @@ class SchemaAnalyzer:
         
         return 'low'
     
-    def _analyze_view_differences(self, source_schema: Dict, target_schema: Dict) -> List[Dict]:
+    def _analyze_view_differences(self, source: SchemaIndex, target: SchemaIndex) -> List[Dict]:
         """Analyze view differences."""
         differences = []
         
-        source_views = {v['view_name']: v for v in source_schema.get('views', [])}
-        target_views = {v['view_name']: v for v in target_schema.get('views', [])}
+        source_views = source.views
+        target_views = target.views
+        
+        created, dropped, common = _split_names(source_views, target_views)
         
         # Views to create
-        for view_name in target_views:
-            if view_name not in source_views:
-                differences.append({
-                    'operation': 'CREATE_VIEW',
-                    'object_name': view_name,
-                    'object_type': 'VIEW',
-                    'details': target_views[view_name],
-                    'risk_level': 'low',
-                    'rollback_operation': 'DROP_VIEW'
-                })
+        for view_name in created:
+            differences.append({
+                'operation': 'CREATE_VIEW',
+                'object_name': view_name,
+                'object_type': 'VIEW',
+                'details': target_views[view_name],
+                'risk_level': 'low',
+                'rollback_operation': 'DROP_VIEW'
+            })
         
         # Views to drop
-        for view_name in source_views:
-            if view_name not in target_views:
+        for view_name in dropped:
+            differences.append({
+                'operation': 'DROP_VIEW',
+                'object_name': view_name,
+                'object_type': 'VIEW',
+                'details': source_views[view_name],
+                'risk_level': 'medium',
+                'rollback_operation': 'CREATE_VIEW'
+            })
+        
+        # Views to alter (definition changed)
+        for view_name in common:
+            if source_views[view_name].get('definition') != target_views[view_name].get('definition'):
                 differences.append({
-                    'operation': 'DROP_VIEW',
+                    'operation': 'ALTER_VIEW',
                     'object_name': view_name,
                     'object_type': 'VIEW',
-                    'details': source_views[view_name],
-                    'risk_level': 'medium',
-                    'rollback_operation': 'CREATE_VIEW'
+                    'details': {
+                        'source': source_views[view_name],
+                        'target': target_views[view_name]
+                    },
+                    'risk_level': 'low',
+                    'rollback_operation': 'ALTER_VIEW'
                 })
         
-        # Views to alter (definition changed)
-        for view_name in source_views:
-            if view_name in target_views:
-                if source_views[view_name].get('definition') != target_views[view_name].get('definition'):
-                    differences.append({
-                        'operation': 'ALTER_VIEW',
-                        'object_name': view_name,
-                        'object_type': 'VIEW',
-                        'details': {
-                            'source': source_views[view_name],
-                            'target': target_views[view_name]
-                        },
-                        'risk_level': 'low',
-                        'rollback_operation': 'ALTER_VIEW'
-                    })
-        
         return differences
     
-    def _analyze_procedure_differences(self, source_schema: Dict, target_schema: Dict) -> List[Dict]:
+    def _analyze_procedure_differences(self, source: SchemaIndex, target: SchemaIndex) -> List[Dict]:
         """Analyze stored procedure differences."""
-        return self._analyze_routine_differences(
-            source_schema.get('stored_procedures', []),
-            target_schema.get('stored_procedures', []),
-            'PROCEDURE'
-        )
+        return self._analyze_routine_differences(source.procedures, target.procedures, 'PROCEDURE')
     
-    def _analyze_function_differences(self, source_schema: Dict, target_schema: Dict) -> List[Dict]:
+    def _analyze_function_differences(self, source: SchemaIndex, target: SchemaIndex) -> List[Dict]:
         """Analyze function differences."""
-        return self._analyze_routine_differences(
-            source_schema.get('functions', []),
-            target_schema.get('functions', []),
-            'FUNCTION'
-        )
+        return self._analyze_routine_differences(source.functions, target.functions, 'FUNCTION')
     
-    def _analyze_routine_differences(self, source_routines: List, target_routines: List, routine_type: str) -> List[Dict]:
+    def _analyze_routine_differences(self, source_dict: Dict[str, Dict], target_dict: Dict[str, Dict],
+                                     routine_type: str) -> List[Dict]:
         """Analyze differences in routines (procedures/functions)."""
         differences = []
+        create_op, drop_op, alter_op = self.ROUTINE_OPERATIONS[routine_type]
         
-        source_dict = {r['routine_name']: r for r in source_routines}
-        target_dict = {r['routine_name']: r for r in target_routines}
+        created, dropped, common = _split_names(source_dict, target_dict)
         
         # Routines to create
-        for routine_name in target_dict:
-            if routine_name not in source_dict:
-                differences.append({
-                    'operation': f'CREATE_{routine_type}',
-                    'object_name': routine_name,
-                    'object_type': routine_type,
-                    'details': target_dict[routine_name],
-                    'risk_level': 'low',
-                    'rollback_operation': f'DROP_{routine_type}'
-                })
+        for routine_name in created:
+            differences.append({
+                'operation': create_op,
+                'object_name': routine_name,
+                'object_type': routine_type,
+                'details': target_dict[routine_name],
+                'risk_level': 'low',
+                'rollback_operation': drop_op
+            })
         
         # Routines to drop
-        for routine_name in source_dict:
-            if routine_name not in target_dict:
+        for routine_name in dropped:
+            differences.append({
+                'operation': drop_op,
+                'object_name': routine_name,
+                'object_type': routine_type,
+                'details': source_dict[routine_name],
+                'risk_level': 'medium',
+                'rollback_operation': create_op
+            })
+        
+        # Routines to alter
+        for routine_name in common:
+            if source_dict[routine_name].get('definition') != target_dict[routine_name].get('definition'):
                 differences.append({
-                    'operation': f'DROP_{routine_type}',
+                    'operation': alter_op,
                     'object_name': routine_name,
                     'object_type': routine_type,
-                    'details': source_dict[routine_name],
+                    'details': {
+                        'source': source_dict[routine_name],
+                        'target': target_dict[routine_name]
+                    },
                     'risk_level': 'medium',
-                    'rollback_operation': f'CREATE_{routine_type}'
+                    'rollback_operation': alter_op
                 })
         
-        # Routines to alter
-        for routine_name in source_dict:
-            if routine_name in target_dict:
-                if source_dict[routine_name].get('definition') != target_dict[routine_name].get('definition'):
-                    differences.append({
-                        'operation': f'ALTER_{routine_type}',
-                        'object_name': routine_name,
-                        'object_type': routine_type,
-                        'details': {
-                            'source': source_dict[routine_name],
-                            'target': target_dict[routine_name]
-                        },
-                        'risk_level': 'medium',
-                        'rollback_operation': f'ALTER_{routine_type}'
-                    })
-        
         return differences
     
-    def _analyze_index_differences(self, source_schema: Dict, target_schema: Dict) -> List[Dict]:
+    def _analyze_index_differences(self, source: SchemaIndex, target: SchemaIndex) -> List[Dict]:
         """Analyze index differences."""
         differences = []
         
-        # Extract indexes from tables
-        source_indexes = {}
-        target_indexes = {}
-        
-        for table in source_schema.get('tables', []):
-            for index in table.get('indexes', []):
-                index_name = index.get('index_name')
-                if index_name:
-                    source_indexes[index_name] = index
-        
-        for table in target_schema.get('tables', []):
-            for index in table.get('indexes', []):
-                index_name = index.get('index_name')
-                if index_name:
-                    target_indexes[index_name] = index
+        source_indexes = source.indexes
+        target_indexes = target.indexes
+        created, dropped, _ = _split_names(source_indexes, target_indexes)
         
         # Indexes to create
-        for index_name in target_indexes:
-            if index_name not in source_indexes:
-                differences.append({
-                    'operation': 'CREATE_INDEX',
-                    'object_name': index_name,
-                    'object_type': 'INDEX',
-                    'details': target_indexes[index_name],
-                    'risk_level': 'low',
-                    'rollback_operation': 'DROP_INDEX'
-                })
+        for index_name in created:
+            differences.append({
+                'operation': 'CREATE_INDEX',
+                'object_name': index_name,
+                'object_type': 'INDEX',
+                'details': target_indexes[index_name],
+                'risk_level': 'low',
+                'rollback_operation': 'DROP_INDEX'
+            })
         
         # Indexes to drop
-        for index_name in source_indexes:
-            if index_name not in target_indexes:
-                differences.append({
-                    'operation': 'DROP_INDEX',
-                    'object_name': index_name,
-                    'object_type': 'INDEX',
-                    'details': source_indexes[index_name],
-                    'risk_level': 'low',
-                    'rollback_operation': 'CREATE_INDEX'
-                })
+        for index_name in dropped:
+            differences.append({
+                'operation': 'DROP_INDEX',
+                'object_name': index_name,
+                'object_type': 'INDEX',
+                'details': source_indexes[index_name],
+                'risk_level': 'low',
+                'rollback_operation': 'CREATE_INDEX'
+            })
         
         return differences
 
@@ -499,6 +765,28 @@ class MigrationScriptGenerator:
     def __init__(self, dialect: str = 'sqlserver'):
         self.dialect = dialect.lower()
         self.script_templates = self._load_script_templates()
+        self._type_sql_cache: Dict[Tuple, str] = {}
+        
+        # Operation type -> SQL builder, looked up once per operation
+        self._sql_dispatch = {
+            'CREATE_TABLE': self._generate_create_table_sql,
+            'DROP_TABLE': lambda d: f"DROP TABLE [{d['table_name']}];",
+            'ADD_COLUMN': self._generate_add_column_sql,
+            'DROP_COLUMN': lambda d: f"ALTER TABLE [{d['table']}] DROP COLUMN [{d['column']['column_name']}];",
+            'ALTER_COLUMN': self._generate_alter_column_sql,
+            'CREATE_VIEW': lambda d: f"CREATE VIEW [{d['view_name']}] AS\n{d['definition']}",
+            'DROP_VIEW': lambda d: f"DROP VIEW [{d['view_name']}];",
+            'ALTER_VIEW': lambda d: f"ALTER VIEW [{d['target']['view_name']}] AS\n{d['target']['definition']}",
+            'CREATE_INDEX': self._generate_create_index_sql,
+            'DROP_INDEX': lambda d: f"DROP INDEX [{d['index_name']}] ON [{d['table_name']}];"
+        }
+        self._rollback_dispatch = {
+            'DROP_TABLE': self._rollback_drop_table,
+            'CREATE_TABLE': self._rollback_create_table,
+            'DROP_COLUMN': self._rollback_drop_column,
+            'ADD_COLUMN': self._rollback_add_column,
+            'ALTER_COLUMN': self._rollback_alter_column
+        }
     
     def _load_script_templates(self) -> Dict[str, str]:
         """Load script templates for different operations."""
@@ -525,100 +813,131 @@ CREATE TABLE [{table_name}] (
             'ALTER_FUNCTION': "ALTER FUNCTION [{function_name}]\n{definition}"
         }
     
-    def generate_migration_script(self, differences: List[Dict]) -> Tuple[str, str]:
-        """Generate forward migration and rollback scripts."""
-        forward_script_parts = ["-- Migration Script Generated on " + datetime.now().isoformat()]
-        rollback_script_parts = ["-- Rollback Script Generated on " + datetime.now().isoformat()]
+    def generate_migration_script(self, differences: List[Dict],
+                                  foreign_keys: Optional[List[Dict]] = None,
+                                  presorted: bool = False) -> Tuple[str, str]:
+        """Generate forward migration and rollback scripts.
+        
+        foreign_keys are relationship entries from the source and target schemas,
+        used to create referenced tables first and drop them last. Pass
+        presorted=True when differences already came from _order_operations.
+        """
+        generated_on = datetime.now().isoformat()
+        forward = io.StringIO()
+        forward.write("-- Migration Script Generated on " + generated_on)
+        rollback = io.StringIO()
+        rollback.write("-- Rollback Script Generated on " + generated_on)
         
         # Order operations by dependency and risk
-        ordered_operations = self._order_operations(differences)
+        ordered_operations = differences if presorted else self._order_operations(differences, foreign_keys)
+        rollback_steps = []
         
         for operation in ordered_operations:
             forward_sql = self._generate_operation_sql(operation)
             rollback_sql = self._generate_rollback_sql(operation)
             
             if forward_sql:
-                forward_script_parts.append(f"\n-- {operation['operation']} {operation['object_name']}")
-                forward_script_parts.append(forward_sql)
+                forward.write(f"\n\n-- {operation['operation']} {operation['object_name']}\n")
+                forward.write(forward_sql)
             
             if rollback_sql:
-                rollback_script_parts.insert(2, rollback_sql)  # Insert at beginning for reverse order
-                rollback_script_parts.insert(2, f"-- Rollback {operation['operation']} {operation['object_name']}")
-        
-        forward_script = "\n".join(forward_script_parts)
-        rollback_script = "\n".join(rollback_script_parts)
-        
-        return forward_script, rollback_script
-    
-    def _order_operations(self, differences: List[Dict]) -> List[Dict]:
-        """Order operations by dependency and risk level."""
-        # Define operation order priorities
-        operation_priority = {
-            'DROP_CONSTRAINT': 1,
-            'DROP_INDEX': 2,
-            'DROP_VIEW': 3,
-            'DROP_PROCEDURE': 4,
-            'DROP_FUNCTION': 5,
-            'ALTER_TABLE': 6,
-            'DROP_COLUMN': 7,
-            'ALTER_COLUMN': 8,
-            'ADD_COLUMN': 9,
-            'CREATE_TABLE': 10,
-            'CREATE_INDEX': 11,
-            'CREATE_VIEW': 12,
-            'CREATE_PROCEDURE': 13,
-            'CREATE_FUNCTION': 14,
-            'CREATE_CONSTRAINT': 15
-        }
-        
-        return sorted(differences, key=lambda x: (
-            operation_priority.get(x['operation'], 99),
-            x['risk_level'],
-            x['object_name']
-        ))
+                rollback_steps.append((f"\n-- Rollback {operation['operation']} {operation['object_name']}\n", rollback_sql))
+        
+        # Undo operations in the reverse of the order they were applied
+        for comment, rollback_sql in reversed(rollback_steps):
+            rollback.write(comment)
+            rollback.write(rollback_sql)
+        
+        return forward.getvalue(), rollback.getvalue()
+    
+    # Operation order priorities
+    OPERATION_PRIORITY = {
+        'DROP_CONSTRAINT': 1,
+        'DROP_INDEX': 2,
+        'DROP_VIEW': 3,
+        'DROP_PROCEDURE': 4,
+        'DROP_FUNCTION': 5,
+        'ALTER_TABLE': 6,
+        'DROP_COLUMN': 7,
+        'ALTER_COLUMN': 8,
+        'ADD_COLUMN': 9,
+        'CREATE_TABLE': 10,
+        'CREATE_INDEX': 11,
+        'CREATE_VIEW': 12,
+        'CREATE_PROCEDURE': 13,
+        'CREATE_FUNCTION': 14,
+        'CREATE_CONSTRAINT': 15
+    }
+    
+    def _order_operations(self, differences: List[Dict],
+                          foreign_keys: Optional[List[Dict]] = None) -> List[Dict]:
+        """Order operations by dependency and risk level.
+        
+        Foreign keys add edges between table operations (parent created before child,
+        child dropped before parent); among operations that are ready, priority,
+        risk and name decide, so without edges this is a plain priority sort.
+        """
+        priority = self.OPERATION_PRIORITY
+        keys = [(priority.get(op['operation'], 99), op['risk_level'], op['object_name'])
+                for op in differences]
+        
+        creates = {op['object_name']: i for i, op in enumerate(differences) if op['operation'] == 'CREATE_TABLE'}
+        drops = {op['object_name']: i for i, op in enumerate(differences) if op['operation'] == 'DROP_TABLE'}
+        successors = defaultdict(list)
+        indegree = [0] * len(differences)
+        
+        for fk in foreign_keys or ():
+            child, parent = fk.get('foreign_key_table'), fk.get('referenced_table')
+            if not child or child == parent:
+                continue
+            for before, after in ((creates.get(parent), creates.get(child)),
+                                  (drops.get(child), drops.get(parent))):
+                if before is not None and after is not None:
+                    successors[before].append(after)
+                    indegree[after] += 1
+        
+        # Kahn's algorithm, always taking the lowest-keyed ready operation
+        ready = [(keys[i], i) for i, degree in enumerate(indegree) if degree == 0]
+        heapq.heapify(ready)
+        ordered = []
+        while ready:
+            _, i = heapq.heappop(ready)
+            ordered.append(differences[i])
+            for j in successors[i]:
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    heapq.heappush(ready, (keys[j], j))
+        
+        # Foreign key cycles can't be ordered; fall back to priority for those
+        if len(ordered) < len(differences):
+            remaining = sorted((keys[i], i) for i, degree in enumerate(indegree) if degree > 0)
+            ordered.extend(differences[i] for _, i in remaining)
+        
+        return ordered
     
     def _generate_operation_sql(self, operation: Dict) -> str:
         """Generate SQL for a single operation."""
-        op_type = operation['operation']
-        details = operation['details']
-        
-        if op_type == 'CREATE_TABLE':
-            return self._generate_create_table_sql(details)
-        elif op_type == 'DROP_TABLE':
-            return f"DROP TABLE [{details['table_name']}];"
-        elif op_type == 'ADD_COLUMN':
-            return self._generate_add_column_sql(details)
-        elif op_type == 'DROP_COLUMN':
-            return f"ALTER TABLE [{details['table']}] DROP COLUMN [{details['column']['column_name']}];"
-        elif op_type == 'ALTER_COLUMN':
-            return self._generate_alter_column_sql(details)
-        elif op_type == 'CREATE_VIEW':
-            return f"CREATE VIEW [{details['view_name']}] AS\n{details['definition']}"
-        elif op_type == 'DROP_VIEW':
-            return f"DROP VIEW [{details['view_name']}];"
-        elif op_type == 'ALTER_VIEW':
-            return f"ALTER VIEW [{details['target']['view_name']}] AS\n{details['target']['definition']}"
-        elif op_type == 'CREATE_INDEX':
-            return self._generate_create_index_sql(details)
-        elif op_type == 'DROP_INDEX':
-            return f"DROP INDEX [{details['index_name']}] ON [{details['table_name']}];"
-        
-        # Add more operation types as needed
-        return f"-- TODO: Implement {op_type} for {operation['object_name']}"
+        handler = self._sql_dispatch.get(operation['operation'])
+        if handler is None:
+            # Add more operation types to _sql_dispatch as needed
+            return f"-- TODO: Implement {operation['operation']} for {operation['object_name']}"
+        return handler(operation['details'])
     
     def _generate_create_table_sql(self, table_details: Dict) -> str:
         """Generate CREATE TABLE SQL."""
         table_name = table_details['table_name']
         columns = table_details.get('columns', [])
         
-        column_definitions = []
+        sql = io.StringIO()
+        sql.write(f"CREATE TABLE [{table_name}] (\n")
+        separator = "    "
         for col in columns:
-            col_def = self._format_column_definition(col)
-            column_definitions.append(f"    {col_def}")
+            sql.write(separator)
+            sql.write(self._format_column_definition(col))
+            separator = ",\n    "
+        sql.write("\n);")
         
-        columns_sql = ",\n".join(column_definitions)
-        
-        return f"CREATE TABLE [{table_name}] (\n{columns_sql}\n);"
+        return sql.getvalue()
     
     def _generate_add_column_sql(self, details: Dict) -> str:
         """Generate ADD COLUMN SQL."""
@@ -639,30 +958,45 @@ CREATE TABLE [{table_name}] (
     def _format_column_definition(self, column: Dict, for_alter: bool = False) -> str:
         """Format a column definition."""
         col_name = column['column_name']
-        data_type = column['data_type'].upper()
-        
-        # Handle data type with precision/scale
-        if column.get('max_length') and column.get('max_length') > 0:
-            if data_type in ['VARCHAR', 'NVARCHAR', 'CHAR', 'NCHAR']:
-                data_type = f"{data_type}({column['max_length']})"
-        elif column.get('precision') and column.get('scale') is not None:
-            data_type = f"{data_type}({column['precision']},{column['scale']})"
-        elif column.get('precision'):
-            data_type = f"{data_type}({column['precision']})"
         
-        col_def = f"[{col_name}] {data_type}"
+        # Columns repeat a handful of types, so each distinct type is rendered once
+        type_key = (column['data_type'], column.get('max_length'),
+                    column.get('precision'), column.get('scale'))
+        data_type = self._type_sql_cache.get(type_key)
+        if data_type is None:
+            data_type = self._type_sql_cache[type_key] = self._format_data_type(*type_key)
         
         # Nullable
-        if column.get('is_nullable') == 'NO':
-            col_def += " NOT NULL"
-        elif column.get('is_nullable') == 'YES' and for_alter:
-            col_def += " NULL"
+        is_nullable = column.get('is_nullable')
+        if is_nullable == 'NO':
+            nullability = " NOT NULL"
+        elif is_nullable == 'YES' and for_alter:
+            nullability = " NULL"
+        else:
+            nullability = ""
         
         # Default value
-        if column.get('default_value'):
-            col_def += f" DEFAULT {column['default_value']}"
+        default_value = column.get('default_value')
+        default = f" DEFAULT {default_value}" if default_value else ""
         
-        return col_def
+        # One format call builds the definition instead of growing it piecewise
+        return f"[{col_name}] {data_type}{nullability}{default}"
+    
+    @staticmethod
+    def _format_data_type(data_type: str, max_length, precision, scale) -> str:
+        """Render a data type with its length or precision/scale."""
+        data_type = data_type.upper()
+        
+        # Handle data type with precision/scale
+        if max_length and max_length > 0:
+            if data_type in _LENGTH_TYPES:
+                data_type = f"{data_type}({max_length})"
+        elif precision and scale is not None:
+            data_type = f"{data_type}({precision},{scale})"
+        elif precision:
+            data_type = f"{data_type}({precision})"
+        
+        return data_type
     
     def _generate_create_index_sql(self, index_details: Dict) -> str:
         """Generate CREATE INDEX SQL."""
@@ -678,27 +1012,45 @@ CREATE TABLE [{table_name}] (
     
     def _generate_rollback_sql(self, operation: Dict) -> str:
         """Generate rollback SQL for an operation."""
-        rollback_op = operation.get('rollback_operation')
-        details = operation['details']
+        handler = self._rollback_dispatch.get(operation.get('rollback_operation'))
+        rollback_sql = handler(operation) if handler else None
         
-        if rollback_op == 'DROP_TABLE':
-            return f"DROP TABLE [{operation['object_name']}];"
-        elif rollback_op == 'CREATE_TABLE' and isinstance(details, dict):
-            return self._generate_create_table_sql(details)
-        elif rollback_op == 'DROP_COLUMN':
-            table_name = details.get('table', operation['object_name'].split('.')[0])
-            column_name = operation['object_name'].split('.')[-1]
-            return f"ALTER TABLE [{table_name}] DROP COLUMN [{column_name}];"
-        elif rollback_op == 'ADD_COLUMN' and 'column' in details:
-            table_name = details['table']
-            col_def = self._format_column_definition(details['column'])
-            return f"ALTER TABLE [{table_name}] ADD {col_def};"
-        elif rollback_op == 'ALTER_COLUMN' and 'source_column' in details:
-            table_name = details['table']
-            col_def = self._format_column_definition(details['source_column'], for_alter=True)
-            return f"ALTER TABLE [{table_name}] ALTER COLUMN {col_def};"
-        
-        return f"-- TODO: Implement rollback for {operation['operation']}"
+        if rollback_sql is None:
+            return f"-- TODO: Implement rollback for {operation['operation']}"
+        return rollback_sql
+    
+    def _rollback_drop_table(self, operation: Dict) -> str:
+        """Drop a created table."""
+        return f"DROP TABLE [{operation['object_name']}];"
+    
+    def _rollback_create_table(self, operation: Dict) -> Optional[str]:
+        """Recreate a dropped table."""
+        details = operation['details']
+        if not isinstance(details, dict):
+            return None
+        return self._generate_create_table_sql(details)
+    
+    def _rollback_drop_column(self, operation: Dict) -> str:
+        """Drop an added column."""
+        table_name = operation['details'].get('table', operation['object_name'].split('.')[0])
+        column_name = operation['object_name'].split('.')[-1]
+        return f"ALTER TABLE [{table_name}] DROP COLUMN [{column_name}];"
+    
+    def _rollback_add_column(self, operation: Dict) -> Optional[str]:
+        """Restore a dropped column."""
+        details = operation['details']
+        if 'column' not in details:
+            return None
+        col_def = self._format_column_definition(details['column'])
+        return f"ALTER TABLE [{details['table']}] ADD {col_def};"
+    
+    def _rollback_alter_column(self, operation: Dict) -> Optional[str]:
+        """Restore a column's original definition."""
+        details = operation['details']
+        if 'source_column' not in details:
+            return None
+        col_def = self._format_column_definition(details['source_column'], for_alter=True)
+        return f"ALTER TABLE [{details['table']}] ALTER COLUMN {col_def};"
 
 
 class MigrationValidator:
@@ -711,14 +1063,36 @@ class MigrationValidator:
             self._validate_data_integrity,
             self._validate_performance_impact
         ]
+        # Last forward script checked and its issues; revalidating an unchanged plan skips the scan
+        self._syntax_memo: Tuple[Optional[str], Tuple[str, ...]] = (None, ())
     
-    def validate_migration_plan(self, migration_data: Dict) -> List[Dict]:
-        """Validate a complete migration plan."""
+    def validate_migration_plan(self, migration_data: Dict,
+                                operations: Optional[List[Dict]] = None) -> List[Dict]:
+        """Validate a complete migration plan.
+        
+        operations may carry the plan's already flattened (and ordered) operations;
+        otherwise they are collected from migration_data['differences'].
+        """
         validation_results = []
         
+        # Flatten the categories once; every rule reads the same tuple
+        if operations is None:
+            operations = (op for ops in migration_data.get('differences', {}).values() for op in ops)
+        operations = tuple(operations)
+        
+        # A plan with no scripts and no operations gives the rules nothing to check
+        if not operations and not migration_data.get('forward_script'):
+            return [{
+                'type': 'noop',
+                'status': 'warning',
+                'message': 'Nothing to validate',
+                'details': {}
+            }]
+        
+        # Each rule keeps its own try so one failing rule cannot hide the others' results
         for rule in self.validation_rules:
             try:
-                result = rule(migration_data)
+                result = rule(migration_data, operations)
                 if result:
                     validation_results.extend(result)
             except Exception as e:
@@ -731,7 +1105,7 @@ class MigrationValidator:
         
         return validation_results
     
-    def _validate_syntax(self, migration_data: Dict) -> List[Dict]:
+    def _validate_syntax(self, migration_data: Dict, operations: Tuple[Dict, ...]) -> List[Dict]:
         """Validate SQL syntax in migration scripts."""
         results = []
         
@@ -739,7 +1113,8 @@ class MigrationValidator:
         rollback_script = migration_data.get('rollback_script', '')
         
         # Basic syntax checks
-        if not forward_script.strip():
+        has_forward_script = bool(forward_script.strip())
+        if not has_forward_script:
             results.append({
                 'type': 'syntax',
                 'status': 'fail',
@@ -755,8 +1130,13 @@ class MigrationValidator:
                 'details': {}
             })
         
-        # Check for basic SQL syntax issues
-        syntax_issues = self._check_basic_syntax(forward_script)
+        # Check for basic SQL syntax issues (an empty script has none to find)
+        checked_script, syntax_issues = self._syntax_memo
+        if not has_forward_script:
+            syntax_issues = ()
+        elif forward_script != checked_script:
+            syntax_issues = tuple(self._check_basic_syntax(forward_script))
+            self._syntax_memo = (forward_script, syntax_issues)
         for issue in syntax_issues:
             results.append({
                 'type': 'syntax',
@@ -771,7 +1151,7 @@ class MigrationValidator:
         """Basic SQL syntax validation."""
         issues = []
         
-        # Check for unmatched brackets
+        # Check for unmatched brackets (str.count runs in C, well ahead of a Python-level pass)
         bracket_count = script.count('[') - script.count(']')
         if bracket_count != 0:
             issues.append("Unmatched square brackets in SQL script")
@@ -781,30 +1161,42 @@ class MigrationValidator:
             issues.append("Unmatched parentheses in SQL script")
         
         # Check for missing semicolons on major statements
-        lines = script.split('\n')
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if (line.upper().startswith(('CREATE ', 'DROP ', 'ALTER ')) and 
-                not line.endswith(';') and not line.endswith('AS')):
-                issues.append(f"Line {i+1} may be missing semicolon: {line[:50]}...")
+        line_number, position = 1, 0
+        for start, line in self._statement_lines(script):
+            if not line.endswith(';') and not line.endswith('AS'):
+                line_number += script.count('\n', position, start)
+                position = start
+                issues.append(f"Line {line_number} may be missing semicolon: {line[:50]}...")
         
         return issues
     
-    def _validate_dependencies(self, migration_data: Dict) -> List[Dict]:
+    @staticmethod
+    def _statement_lines(script: str):
+        """Yield (offset, stripped line) for lines opening a CREATE/DROP/ALTER statement."""
+        if not script.isascii():
+            # upper() may change the length of non-ASCII text, so match case-insensitively
+            for match in _STATEMENT_LINE_RE.finditer(script):
+                yield match.start(), match.group(1)
+            return
+        
+        # One linear pass over the lines; only a short prefix of each is upper-cased
+        offset = 0
+        for line in script.split('\n'):
+            stripped = line.strip()
+            # A stripped line ends in non-space, so text always follows the keyword's space
+            if stripped[:7].upper().startswith(_STATEMENT_KEYWORDS):
+                yield offset, stripped
+            offset += len(line) + 1
+    
+    def _validate_dependencies(self, migration_data: Dict, operations: Tuple[Dict, ...]) -> List[Dict]:
         """Validate operation dependencies."""
         results = []
         
-        differences = migration_data.get('differences', {})
-        all_operations = []
-        
-        for category in differences.values():
-            all_operations.extend(category)
-        
         # Check for dependency violations
-        table_operations = self._group_operations_by_table(all_operations)
+        table_operations = self._group_operations_by_table(operations)
         
-        for table_name, operations in table_operations.items():
-            dependency_issues = self._check_table_operation_dependencies(operations)
+        for table_name, table_ops in table_operations.items():
+            dependency_issues = self._check_table_operation_dependencies(table_ops)
             for issue in dependency_issues:
                 results.append({
                     'type': 'dependency',
@@ -815,21 +1207,22 @@ class MigrationValidator:
         
         return results
     
-    def _group_operations_by_table(self, operations: List[Dict]) -> Dict[str, List[Dict]]:
+    def _group_operations_by_table(self, operations: Tuple[Dict, ...]) -> Dict[str, List[Dict]]:
         """Group operations by affected table."""
         table_ops = defaultdict(list)
         
         for op in operations:
             object_name = op.get('object_name', '')
             
-            if '.' in object_name:
-                table_name = object_name.split('.')[0]
+            # find() and a slice avoid building a list just to take its first part
+            dot = object_name.find('.')
+            if dot >= 0:
+                table_name = object_name[:dot]
             elif op.get('object_type') == 'TABLE':
                 table_name = object_name
-            elif 'table' in op.get('details', {}):
-                table_name = op['details']['table']
             else:
-                table_name = 'unknown'
+                details = op.get('details', {})
+                table_name = details['table'] if 'table' in details else 'unknown'
             
             table_ops[table_name].append(op)
         
@@ -839,16 +1232,18 @@ class MigrationValidator:
         """Check dependencies within table operations."""
         issues = []
         
-        has_drop_table = any(op['operation'] == 'DROP_TABLE' for op in operations)
-        has_create_table = any(op['operation'] == 'CREATE_TABLE' for op in operations)
-        has_alter_operations = any(op['operation'].startswith('ALTER_') for op in operations)
+        # Distinct operation names are few, so membership and the ALTER_ scan run over a tiny set
+        operation_names = {op['operation'] for op in operations}
+        has_drop_table = 'DROP_TABLE' in operation_names
+        has_create_table = 'CREATE_TABLE' in operation_names
+        has_alter_operations = any(name.startswith('ALTER_') for name in operation_names)
         
         if has_drop_table and (has_create_table or has_alter_operations):
             issues.append("Table is both dropped and modified in same migration")
         
         return issues
     
-    def _validate_data_integrity(self, migration_data: Dict) -> List[Dict]:
+    def _validate_data_integrity(self, migration_data: Dict, operations: Tuple[Dict, ...]) -> List[Dict]:
         """Validate potential data integrity issues."""
         results = []
         
@@ -883,9 +1278,6 @@ class MigrationValidator:
     
     def _is_lossy_type_change(self, source_col: Dict, target_col: Dict) -> bool:
         """Check if column type change is potentially lossy."""
-        source_type = source_col.get('data_type', '').upper()
-        target_type = target_col.get('data_type', '').upper()
-        
         # Size reductions
         source_length = source_col.get('max_length', 0)
         target_length = target_col.get('max_length', 0)
@@ -902,34 +1294,36 @@ class MigrationValidator:
         
         return False
     
-    def _validate_performance_impact(self, migration_data: Dict) -> List[Dict]:
+    def _validate_performance_impact(self, migration_data: Dict, operations: Tuple[Dict, ...]) -> List[Dict]:
         """Validate potential performance impacts."""
         results = []
         
-        differences = migration_data.get('differences', {})
+        # Count index drops and table alterations in a single pass
+        index_drops = 0
+        table_alterations = 0
+        for op in operations:
+            operation = op['operation']
+            if operation == 'DROP_INDEX':
+                index_drops += 1
+            elif operation.startswith('ALTER_TABLE'):
+                table_alterations += 1
         
         # Check for operations that might impact performance
-        index_drops = [op for ops in differences.values() for op in ops 
-                      if op['operation'] == 'DROP_INDEX']
-        
-        if len(index_drops) > 5:
+        if index_drops > 5:
             results.append({
                 'type': 'performance_impact',
                 'status': 'warning',
-                'message': f"Migration drops {len(index_drops)} indexes, which may impact query performance",
-                'details': {'dropped_indexes': len(index_drops)}
+                'message': f"Migration drops {index_drops} indexes, which may impact query performance",
+                'details': {'dropped_indexes': index_drops}
             })
         
         # Check for large table alterations
-        alter_table_ops = [op for ops in differences.values() for op in ops 
-                          if op['operation'].startswith('ALTER_TABLE')]
-        
-        if len(alter_table_ops) > 10:
+        if table_alterations > 10:
             results.append({
                 'type': 'performance_impact',
                 'status': 'warning',
                 'message': "Migration includes many table alterations, consider breaking into smaller migrations",
-                'details': {'table_alterations': len(alter_table_ops)}
+                'details': {'table_alterations': table_alterations}
             })
         
         return results
@@ -938,7 +1332,11 @@ class MigrationValidator:
 class MigrationPlannerGUI:
     """GUI for database migration planning."""
     
+    # Characters inserted into a script view per idle callback
+    SCRIPT_CHUNK_SIZE = 65536
+    
     def __init__(self, parent):
+        _import_tk()
         self.parent = parent
         self.migration_db = MigrationDatabase()
         self.schema_analyzer = SchemaAnalyzer()
@@ -946,10 +1344,16 @@ class MigrationPlannerGUI:
         self.validator = MigrationValidator()
         
         self.current_plan_data = None
+        self.current_plan_id = None
         self.source_schema_data = None
         self.target_schema_data = None
+        # Operations of the current plan in execution order, shared by every view
+        self.ordered_operations = None
+        # The ordered_operations list the displayed scripts were generated from
+        self._scripts_generated_from = None
+        self._script_stream_jobs = {}
     
-    def create_migration_tab(self, notebook: ttk.Notebook):
+    def create_migration_tab(self, notebook: 'ttk.Notebook'):
         """Create the migration planning tab."""
         # Create main frame
         migration_frame = ttk.Frame(notebook)
@@ -971,7 +1375,7 @@ class MigrationPlannerGUI:
         # Validation tab
         self.create_validation_tab(sub_notebook)
     
-    def create_comparison_tab(self, notebook: ttk.Notebook):
+    def create_comparison_tab(self, notebook: 'ttk.Notebook'):
         """Create schema comparison tab."""
         comparison_frame = ttk.Frame(notebook)
         notebook.add(comparison_frame, text="Schema Comparison")
@@ -1005,8 +1409,10 @@ class MigrationPlannerGUI:
                   command=self.load_target_schema).pack(side='left', padx=5)
         
         # Compare button
-        ttk.Button(selection_frame, text="Compare Schemas",
-                  command=self.compare_schemas).pack(pady=10)
+        self.compare_button = ttk.Button(selection_frame, text="Compare Schemas",
+                                        command=self.compare_schemas)
+        self.compare_button.pack(pady=10)
+        self.comparison_progress = ttk.Progressbar(selection_frame, mode='indeterminate')
         
         # Results section
         results_frame = ttk.LabelFrame(comparison_frame, text="Schema Differences", padding="5")
@@ -1033,7 +1439,7 @@ class MigrationPlannerGUI:
         # Context menu for differences
         self.differences_tree.bind("<Button-3>", self.show_difference_context_menu)
     
-    def create_plan_tab(self, notebook: ttk.Notebook):
+    def create_plan_tab(self, notebook: 'ttk.Notebook'):
         """Create migration plan tab."""
         plan_frame = ttk.Frame(notebook)
         notebook.add(plan_frame, text="Migration Plan")
@@ -1094,9 +1500,11 @@ class MigrationPlannerGUI:
         
         ttk.Button(button_frame, text="Save Plan", command=self.save_migration_plan).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Load Plan", command=self.load_migration_plan).pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Generate Scripts", command=self.generate_migration_scripts).pack(side='left', padx=5)
+        self.generate_button = ttk.Button(button_frame, text="Generate Scripts", command=self.generate_migration_scripts)
+        self.generate_button.pack(side='left', padx=5)
+        self.generate_progress = ttk.Progressbar(button_frame, mode='indeterminate')
     
-    def create_script_tab(self, notebook: ttk.Notebook):
+    def create_script_tab(self, notebook: 'ttk.Notebook'):
         """Create script generation tab."""
         script_frame = ttk.Frame(notebook)
         notebook.add(script_frame, text="Generated Scripts")
@@ -1129,7 +1537,7 @@ class MigrationPlannerGUI:
         ttk.Button(actions_frame, text="Copy to Clipboard", command=self.copy_script_to_clipboard).pack(side='left', padx=5)
         ttk.Button(actions_frame, text="Execute Migration", command=self.execute_migration).pack(side='right', padx=5)
     
-    def create_validation_tab(self, notebook: ttk.Notebook):
+    def create_validation_tab(self, notebook: 'ttk.Notebook'):
         """Create validation results tab."""
         validation_frame = ttk.Frame(notebook)
         notebook.add(validation_frame, text="Validation Results")
@@ -1138,8 +1546,10 @@ class MigrationPlannerGUI:
         controls_frame = ttk.Frame(validation_frame)
         controls_frame.pack(fill='x', padx=5, pady=5)
         
-        ttk.Button(controls_frame, text="Validate Plan", command=self.validate_migration_plan).pack(side='left', padx=5)
+        self.validate_button = ttk.Button(controls_frame, text="Validate Plan", command=self.validate_migration_plan)
+        self.validate_button.pack(side='left', padx=5)
         ttk.Button(controls_frame, text="Clear Results", command=self.clear_validation_results).pack(side='left', padx=5)
+        self.validation_progress = ttk.Progressbar(controls_frame, mode='indeterminate')
         
         # Validation results
         results_frame = ttk.LabelFrame(validation_frame, text="Validation Results", padding="5")
@@ -1170,8 +1580,10 @@ class MigrationPlannerGUI:
         
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    self.source_schema_data = json.load(f)
+                # Raw bytes go straight to the parser without a text decode pass
+                with open(filename, 'rb') as f:
+                    self.source_schema_data = _intern_schema(_json_loads(f.read()))
+                self.ordered_operations = None
                 self.source_schema_var.set(f"File: {os.path.basename(filename)}")
                 messagebox.showinfo("Success", "Source schema loaded successfully")
             except Exception as e:
@@ -1186,8 +1598,10 @@ class MigrationPlannerGUI:
         
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    self.target_schema_data = json.load(f)
+                # Raw bytes go straight to the parser without a text decode pass
+                with open(filename, 'rb') as f:
+                    self.target_schema_data = _intern_schema(_json_loads(f.read()))
+                self.ordered_operations = None
                 self.target_schema_var.set(f"File: {os.path.basename(filename)}")
                 messagebox.showinfo("Success", "Target schema loaded successfully")
             except Exception as e:
@@ -1203,34 +1617,76 @@ class MigrationPlannerGUI:
             messagebox.showwarning("Missing Target", "Please load target schema first")
             return
         
+        # Analysis runs off the Tk thread; results come back through the button's after()
+        # (parent is the host application object, not necessarily a Tk widget)
+        self._start_progress(self.compare_button, self.comparison_progress, fill='x')
+        
+        thread = threading.Thread(target=self._compare_schemas_thread,
+                                  args=(self.source_schema_data, self.target_schema_data,
+                                        self._schema_foreign_keys()))
+        thread.daemon = True
+        thread.start()
+    
+    def _compare_schemas_thread(self, source_schema: Dict, target_schema: Dict, foreign_keys: List[Dict]):
+        """Thread function for analyzing schema differences."""
         try:
-            # Analyze differences
-            differences = self.schema_analyzer.analyze_schema_differences(
-                self.source_schema_data, self.target_schema_data
-            )
-            
-            # Clear existing results
-            for item in self.differences_tree.get_children():
-                self.differences_tree.delete(item)
-            
-            # Populate differences tree
-            for category, ops in differences.items():
-                for op in ops:
-                    self.differences_tree.insert('', 'end', values=(
-                        op['operation'],
-                        op['object_name'],
-                        op['object_type'],
-                        op['risk_level'],
-                        str(op['details'])[:100] + "..." if len(str(op['details'])) > 100 else str(op['details'])
-                    ))
+            differences = self.schema_analyzer.analyze_schema_differences(source_schema, target_schema)
+            # Order once here; scripts, validation and the plan view all reuse it
+            operations = [op for ops in differences.values() for op in ops]
+            ordered = self.script_generator._order_operations(operations, foreign_keys)
+            self.compare_button.after(0, self._comparison_complete, differences, ordered)
+        except Exception as e:
+            self.compare_button.after(0, self._comparison_failed, str(e))
+    
+    def _comparison_complete(self, differences: Dict[str, List[Dict]], ordered_operations: List[Dict]):
+        """Show schema differences computed by the worker thread."""
+        self._stop_progress(self.compare_button, self.comparison_progress)
+        
+        try:
+            # Build the rows first, then replace the tree contents in one pass
+            # itemgetter fetches the four display fields in one C call per row
+            fields = itemgetter('operation', 'object_name', 'object_type', 'risk_level')
+            rows = [(*fields(op), _preview(str(op['details'])))
+                    for ops in differences.values() for op in ops]
+            self._fill_tree(self.differences_tree, rows)
             
             # Store differences for later use
             self.current_plan_data = {'differences': differences}
+            self.current_plan_id = None
+            self.ordered_operations = ordered_operations
             
             messagebox.showinfo("Success", f"Schema comparison completed. Found {sum(len(ops) for ops in differences.values())} differences.")
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to compare schemas: {str(e)}")
+            self._comparison_failed(str(e))
+    
+    def _comparison_failed(self, error: str):
+        """Report a failed schema comparison."""
+        self._stop_progress(self.compare_button, self.comparison_progress)
+        messagebox.showerror("Error", f"Failed to compare schemas: {error}")
+    
+    @staticmethod
+    def _fill_tree(tree: 'ttk.Treeview', rows: List[Tuple]):
+        """Replace every item in a tree view with the given rows."""
+        # One delete call clears the tree; the bound insert avoids an attribute lookup per row
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        insert = tree.insert
+        for values in rows:
+            insert('', 'end', values=values)
+    
+    def _start_progress(self, button: 'ttk.Button', progress: 'ttk.Progressbar', **pack_options):
+        """Disable an action button and show its busy indicator."""
+        button.configure(state="disabled")
+        progress.pack(padx=5, **pack_options)
+        progress.start(10)
+    
+    def _stop_progress(self, button: 'ttk.Button', progress: 'ttk.Progressbar'):
+        """Hide a busy indicator and re-enable its action button."""
+        progress.stop()
+        progress.pack_forget()
+        button.configure(state="normal")
     
     def save_migration_plan(self):
         """Save the current migration plan."""
@@ -1260,6 +1716,7 @@ class MigrationPlannerGUI:
                 dependencies=[]
             )
             
+            self.current_plan_id = plan_id
             messagebox.showinfo("Success", f"Migration plan saved with ID: {plan_id}")
             
         except Exception as e:
@@ -1294,33 +1751,23 @@ class MigrationPlannerGUI:
         self.risk_level_var.set(plan_data.get('risk_level', 'medium'))
         self.duration_var.set(plan_data.get('estimated_duration', 30))
         
-        self.current_plan_data = plan_data.get('migration_data', {})
+        self.current_plan_id = plan_data.get('id')
+        # Copy so generated scripts don't leak into the database's plan cache
+        self.current_plan_data = dict(plan_data.get('migration_data', {}))
+        self.ordered_operations = None
         
         # Update operations tree
         self._update_operations_tree()
     
     def _update_operations_tree(self):
         """Update the operations tree view."""
-        # Clear existing items
-        for item in self.operations_tree.get_children():
-            self.operations_tree.delete(item)
-        
-        if not self.current_plan_data or 'differences' not in self.current_plan_data:
-            return
+        rows = []
+        if self.current_plan_data and 'differences' in self.current_plan_data:
+            operations = self._plan_operations()
+            fields = itemgetter('operation', 'object_name', 'risk_level')
+            rows = [(order, *fields(op), 'pending') for order, op in enumerate(operations, 1)]
         
-        differences = self.current_plan_data['differences']
-        order = 1
-        
-        for category, ops in differences.items():
-            for op in ops:
-                self.operations_tree.insert('', 'end', values=(
-                    order,
-                    op['operation'],
-                    op['object_name'],
-                    op['risk_level'],
-                    'pending'
-                ))
-                order += 1
+        self._fill_tree(self.operations_tree, rows)
     
     def generate_migration_scripts(self):
         """Generate migration and rollback scripts."""
@@ -1328,54 +1775,146 @@ class MigrationPlannerGUI:
             messagebox.showwarning("No Plan", "Please create a migration plan first")
             return
         
+        # Any change to the plan or schemas replaces ordered_operations, so identity means unchanged
+        if self.ordered_operations is not None and self._scripts_generated_from is self.ordered_operations:
+            messagebox.showinfo("Success", "Migration scripts are already up to date")
+            return
+        
+        # Ordering and generation run off the Tk thread; results come back through the button's after()
+        self._start_progress(self.generate_button, self.generate_progress, side='left')
+        
+        thread = threading.Thread(target=self._generate_migration_scripts_thread,
+                                  args=(self.current_plan_data, self.ordered_operations,
+                                        self._schema_foreign_keys()))
+        thread.daemon = True
+        thread.start()
+    
+    def _generate_migration_scripts_thread(self, plan_data: Dict, ordered_operations: Optional[List[Dict]],
+                                           foreign_keys: List[Dict]):
+        """Thread function for generating migration scripts."""
         try:
-            differences = self.current_plan_data['differences']
-            all_operations = []
-            
-            # Flatten all operations
-            for category, ops in differences.items():
-                all_operations.extend(ops)
-            
-            # Generate scripts
-            forward_script, rollback_script = self.script_generator.generate_migration_script(all_operations)
+            if ordered_operations is None:
+                ordered_operations = self._order_plan_operations(plan_data, foreign_keys)
             
+            # Generate scripts from the plan's dependency-ordered operations
+            forward_script, rollback_script = self.script_generator.generate_migration_script(
+                ordered_operations, presorted=True
+            )
+            self.generate_button.after(0, self._scripts_generated, plan_data, ordered_operations,
+                                       forward_script, rollback_script)
+        except Exception as e:
+            self.generate_button.after(0, self._script_generation_failed, str(e))
+    
+    def _scripts_generated(self, plan_data: Dict, ordered_operations: List[Dict],
+                           forward_script: str, rollback_script: str):
+        """Show scripts generated by the worker thread."""
+        self._stop_progress(self.generate_button, self.generate_progress)
+        
+        # Store scripts in plan data
+        plan_data['forward_script'] = forward_script
+        plan_data['rollback_script'] = rollback_script
+        
+        # The plan may have been replaced while the worker ran
+        if plan_data is not self.current_plan_data:
+            return
+        if self.ordered_operations is None:
+            self.ordered_operations = ordered_operations
+        if self.ordered_operations is ordered_operations:
+            self._scripts_generated_from = ordered_operations
+        
+        try:
             # Display scripts
-            self.forward_script_text.delete(1.0, tk.END)
-            self.forward_script_text.insert(1.0, forward_script)
-            
-            self.rollback_script_text.delete(1.0, tk.END)
-            self.rollback_script_text.insert(1.0, rollback_script)
-            
-            # Store scripts in plan data
-            self.current_plan_data['forward_script'] = forward_script
-            self.current_plan_data['rollback_script'] = rollback_script
+            self._stream_script(self.forward_script_text, forward_script)
+            self._stream_script(self.rollback_script_text, rollback_script)
             
             messagebox.showinfo("Success", "Migration scripts generated successfully")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate scripts: {str(e)}")
     
+    def _script_generation_failed(self, error: str):
+        """Report failed script generation."""
+        self._stop_progress(self.generate_button, self.generate_progress)
+        messagebox.showerror("Error", f"Failed to generate scripts: {error}")
+    
+    def _schema_foreign_keys(self) -> List[Dict]:
+        """Foreign keys from both loaded schemas, used to order table creates and drops."""
+        return [fk for schema in (self.source_schema_data, self.target_schema_data) if schema
+                for fk in schema.get('relationships', {}).get('foreign_keys', [])]
+    
+    def _plan_operations(self) -> List[Dict]:
+        """The current plan's operations in execution order, ordered on first use."""
+        if self.ordered_operations is None:
+            self.ordered_operations = self._order_plan_operations(
+                self.current_plan_data, self._schema_foreign_keys())
+        return self.ordered_operations
+    
+    def _order_plan_operations(self, plan_data: Dict, foreign_keys: List[Dict]) -> List[Dict]:
+        """Flatten a plan's differences into dependency order."""
+        differences = plan_data.get('differences', {})
+        operations = [op for ops in differences.values() for op in ops]
+        return self.script_generator._order_operations(operations, foreign_keys)
+    
+    def _stream_script(self, widget: 'scrolledtext.ScrolledText', text: str):
+        """Replace a script view's text, inserting it in chunks between UI events."""
+        # A stream still filling this widget from an earlier run would interleave its text
+        pending = self._script_stream_jobs.pop(str(widget), None)
+        if pending:
+            widget.after_cancel(pending)
+        
+        widget.delete(1.0, tk.END)
+        self._insert_script_chunk(widget, text, 0)
+    
+    def _insert_script_chunk(self, widget: 'scrolledtext.ScrolledText', text: str, position: int):
+        """Append one chunk of a script and schedule the next."""
+        end = position + self.SCRIPT_CHUNK_SIZE
+        widget.insert(tk.END, text[position:end])
+        
+        if end < len(text):
+            self._script_stream_jobs[str(widget)] = widget.after_idle(
+                self._insert_script_chunk, widget, text, end)
+        else:
+            self._script_stream_jobs.pop(str(widget), None)
+    
     def validate_migration_plan(self):
         """Validate the current migration plan."""
         if not self.current_plan_data:
             messagebox.showwarning("No Plan", "Please create a migration plan first")
             return
         
+        # Validation runs off the Tk thread; results come back through the button's after()
+        self._start_progress(self.validate_button, self.validation_progress, side='left')
+        
+        thread = threading.Thread(target=self._validate_migration_plan_thread,
+                                  args=(self.current_plan_data, self.ordered_operations, self.current_plan_id))
+        thread.daemon = True
+        thread.start()
+    
+    def _validate_migration_plan_thread(self, plan_data: Dict, operations: Optional[List[Dict]],
+                                        plan_id: Optional[int]):
+        """Thread function for validating a migration plan."""
         try:
-            validation_results = self.validator.validate_migration_plan(self.current_plan_data)
+            validation_results = self.validator.validate_migration_plan(plan_data, operations)
             
-            # Clear existing results
-            for item in self.validation_tree.get_children():
-                self.validation_tree.delete(item)
+            # Record results against the saved plan in one batch
+            if plan_id is not None and validation_results:
+                self.migration_db.log_validations_batch(plan_id, validation_results)
             
+            self.validate_button.after(0, self._validation_complete, validation_results)
+        except Exception as e:
+            self.validate_button.after(0, self._validation_failed, str(e))
+    
+    def _validation_complete(self, validation_results: List[Dict]):
+        """Show validation results computed by the worker thread."""
+        self._stop_progress(self.validate_button, self.validation_progress)
+        
+        try:
             # Add validation results
-            for result in validation_results:
-                self.validation_tree.insert('', 'end', values=(
-                    result['type'],
-                    result['status'],
-                    result['message'],
-                    json.dumps(result.get('details', {}))[:100] + "..."
-                ))
+            fields = itemgetter('type', 'status', 'message')
+            # Empty details stay blank; the rest are serialized once, by orjson when available
+            rows = [(*fields(result), _preview(_json_dumps(result['details'])) if result.get('details') else '')
+                    for result in validation_results]
+            self._fill_tree(self.validation_tree, rows)
             
             # Show summary
             total_issues = len(validation_results)
@@ -1386,12 +1925,16 @@ class MigrationPlannerGUI:
                               f"Validation completed.\nTotal issues: {total_issues}\nErrors: {errors}\nWarnings: {warnings}")
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to validate migration plan: {str(e)}")
+            self._validation_failed(str(e))
+    
+    def _validation_failed(self, error: str):
+        """Report a failed plan validation."""
+        self._stop_progress(self.validate_button, self.validation_progress)
+        messagebox.showerror("Error", f"Failed to validate migration plan: {error}")
     
     def clear_validation_results(self):
         """Clear validation results."""
-        for item in self.validation_tree.get_children():
-            self.validation_tree.delete(item)
+        self._fill_tree(self.validation_tree, [])
     
     def export_scripts(self):
         """Export generated scripts to files."""
@@ -1399,25 +1942,30 @@ class MigrationPlannerGUI:
             messagebox.showwarning("No Scripts", "Please generate scripts first")
             return
         
-        try:
-            directory = filedialog.askdirectory(title="Select Export Directory")
-            if directory:
-                plan_name = self.plan_name_var.get().strip() or "migration"
-                
-                # Export forward script
-                forward_file = os.path.join(directory, f"{plan_name}_migration.sql")
-                with open(forward_file, 'w', encoding='utf-8') as f:
-                    f.write(self.current_plan_data['forward_script'])
-                
-                # Export rollback script
-                rollback_file = os.path.join(directory, f"{plan_name}_rollback.sql")
-                with open(rollback_file, 'w', encoding='utf-8') as f:
-                    f.write(self.current_plan_data['rollback_script'])
-                
-                messagebox.showinfo("Success", f"Scripts exported to:\n{forward_file}\n{rollback_file}")
+        directory = filedialog.askdirectory(title="Select Export Directory")
+        if not directory:
+            return
         
-        except Exception as e:
+        # Sanitize once so characters like ':' or '/' cannot break either path
+        plan_name = _UNSAFE_FILENAME_RE.sub('_', self.plan_name_var.get().strip()) or "migration"
+        base_path = os.path.join(directory, plan_name)
+        
+        forward_file = f"{base_path}_migration.sql"
+        rollback_file = f"{base_path}_rollback.sql"
+        
+        # Only the file writes can fail here; anything else is a bug and should surface as one
+        try:
+            # Forward and rollback files are independent, so write them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                writes = [executor.submit(_write_script_file, forward_file, self.current_plan_data['forward_script']),
+                          executor.submit(_write_script_file, rollback_file, self.current_plan_data['rollback_script'])]
+                for write in writes:
+                    write.result()
+        except OSError as e:
             messagebox.showerror("Error", f"Failed to export scripts: {str(e)}")
+            return
+        
+        messagebox.showinfo("Success", f"Scripts exported to:\n{forward_file}\n{rollback_file}")
     
     def copy_script_to_clipboard(self):
         """Copy current script to clipboard."""
@@ -1443,7 +1991,11 @@ class MigrationPlannerGUI:
 class PlanSelectionDialog:
     """Dialog for selecting migration plans."""
     
+    # Plan names added to the listbox each time the user scrolls to its end
+    PAGE_SIZE = 200
+    
     def __init__(self, parent, plan_names: List[str], plans: List[Dict]):
+        _import_tk()
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Select Migration Plan")
         self.dialog.geometry("600x400")
@@ -1473,14 +2025,16 @@ class PlanSelectionDialog:
         listbox_frame.pack(fill="both", expand=True, pady=(0, 20))
         
         self.plans_listbox = tk.Listbox(listbox_frame, height=15)
-        scrollbar = ttk.Scrollbar(listbox_frame, orient="vertical", command=self.plans_listbox.yview)
-        self.plans_listbox.configure(yscrollcommand=scrollbar.set)
+        self.plans_scrollbar = ttk.Scrollbar(listbox_frame, orient="vertical", command=self.plans_listbox.yview)
+        self.plans_listbox.configure(yscrollcommand=self._on_plans_scrolled)
         
-        for name in plan_names:
-            self.plans_listbox.insert(tk.END, name)
+        # Names are loaded a page at a time, so large catalogs open as fast as small ones
+        self.plan_names = plan_names
+        self.loaded_plans = 0
+        self._load_more_plans()
         
         self.plans_listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.plans_scrollbar.pack(side="right", fill="y")
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
@@ -1489,11 +2043,28 @@ class PlanSelectionDialog:
         ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side="right", padx=(5, 0))
         ttk.Button(button_frame, text="Select", command=self.select_plan).pack(side="right")
     
+    def _load_more_plans(self):
+        """Append the next page of plan names to the listbox."""
+        page = self.plan_names[self.loaded_plans:self.loaded_plans + self.PAGE_SIZE]
+        if page:
+            # Listbox.insert takes any number of items, so one Tcl call adds the page
+            self.plans_listbox.insert(tk.END, *page)
+            self.loaded_plans += len(page)
+    
+    def _on_plans_scrolled(self, first: str, last: str):
+        """Track the listbox view, loading more names once its end is visible."""
+        self.plans_scrollbar.set(first, last)
+        if float(last) >= 1.0 and self.loaded_plans < len(self.plan_names):
+            self._load_more_plans()
+    
     def select_plan(self):
         """Select the chosen plan."""
         selection = self.plans_listbox.curselection()
-        if selection:
-            self.selected_plan = self.plans[selection[0]]
+        index = selection[0] if selection else -1
+        
+        # Listbox rows map onto plans by position; anything out of range is no selection
+        if 0 <= index < len(self.plans):
+            self.selected_plan = self.plans[index]
             self.dialog.destroy()
         else:
             messagebox.showwarning("No Selection", "Please select a migration plan.")
@@ -1546,6 +2117,9 @@ if __name__ == "__main__":
         'functions': []
     }
     
+    _intern_schema(source_schema)
+    _intern_schema(target_schema)
+    
     # Test schema analysis
     analyzer = SchemaAnalyzer()
     differences = analyzer.analyze_schema_differences(source_schema, target_schema)
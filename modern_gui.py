@@ -25,31 +25,96 @@ import os
 import sys
 import json
 import logging
+import importlib
+import queue
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
-# Import existing modules
-from db_connection import AzureSQLConnection
+# Import existing modules needed to build the main window; heavier
+# subsystems are listed in _LAZY_IMPORTS and imported on first use
 from config_manager import ConfigManager
-from documentation_extractor import DocumentationExtractor
-from documentation_generator import DocumentationGenerator
 from connection_profiles import ConnectionProfileManager
-from schema_comparison import SchemaComparator
-from dependency_visualizer import DependencyVisualizer, VisualizationType
-from object_details import ObjectDetailsManager
-from template_editor import TemplateEditor
 from scheduler_monitor import JobScheduler, DatabaseMonitor, create_documentation_job_handler
 from project_manager import ProjectManager, DatabaseProject, ProjectSelectionDialog, CreateProjectDialog, BatchOperationDialog
-from api_integration import APIServer, WebhookManager, PlatformIntegration, WebhookConfigDialog, PlatformIntegrationDialog
-from reporting_analytics import ReportingDashboard
-from migration_planner import MigrationPlannerGUI
-from compliance_auditor import ComplianceAuditorGUI
-from database_playground import DatabasePlayground, create_playground_panel
-from schema_explorer import SchemaExplorer, create_schema_explorer_panel
-from performance_dashboard import PerformanceDashboard, create_performance_dashboard_panel
+
+# Names this module used to import eagerly, mapped to their home module.
+# Methods import what they need locally; __getattr__ keeps attribute access
+# such as ``modern_gui.ReportingDashboard`` working for outside callers.
+_LAZY_IMPORTS = {
+    'AzureSQLConnection': 'db_connection',
+    'DocumentationExtractor': 'documentation_extractor',
+    'DocumentationGenerator': 'documentation_generator',
+    'SchemaComparator': 'schema_comparison',
+    'DependencyVisualizer': 'dependency_visualizer',
+    'VisualizationType': 'dependency_visualizer',
+    'ObjectDetailsManager': 'object_details',
+    'TemplateEditor': 'template_editor',
+    'APIServer': 'api_integration',
+    'WebhookManager': 'api_integration',
+    'PlatformIntegration': 'api_integration',
+    'WebhookConfigDialog': 'api_integration',
+    'PlatformIntegrationDialog': 'api_integration',
+    'ReportingDashboard': 'reporting_analytics',
+    'MigrationPlannerGUI': 'migration_planner',
+    'ComplianceAuditorGUI': 'compliance_auditor',
+    'DatabasePlayground': 'database_playground',
+    'create_playground_panel': 'database_playground',
+    'SchemaExplorer': 'schema_explorer',
+    'create_schema_explorer_panel': 'schema_explorer',
+    'PerformanceDashboard': 'performance_dashboard',
+    'create_performance_dashboard_panel': 'performance_dashboard',
+}
+
+
+def __getattr__(name):
+    """Import a lazily loaded name on first module attribute access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+class _cached_property:
+    """Compute an attribute once on first access and store it on the instance."""
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.attrname] = value
+        return value
+
+
+class _LazyTkVar:
+    """Class-level Tk variable declaration created per instance on first access."""
+
+    def __init__(self, var_type, value):
+        self.var_type = var_type
+        self.value = value
+
+    def __set_name__(self, owner, name):
+        self.attrname = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        var = self.var_type(master=instance.root, value=self.value)
+        instance.__dict__[self.attrname] = var
+        return var
+
 
 # Import new UI framework with Phase 1 & 2 enhancements
 from ui_framework import (ThemeManager, StatusManager, CardComponent, SidebarNavigation, 
@@ -68,6 +133,85 @@ from enhanced_controls import (ValidatedEntry, ToggleSwitch, CollapsibleFrame, T
 class ModernDatabaseDocumentationGUI:
     """Modern GUI application with enhanced UX."""
     
+    # Sidebar entries as (icon, title, description, callback method name,
+    # panel factory method name or None for views without a lazy panel)
+    NAV_ITEMS = (
+        ('🏠', 'Dashboard', 'Overview and quick actions', 'show_dashboard', None),
+        ('🔌', 'Connection', 'Database connection settings', 'show_connection', 'create_connection_panel'),
+        ('🗄️', 'Databases', 'Available databases', 'show_databases', 'create_databases_panel'),
+        ('🎮', 'Playground', 'Interactive query builder and tutorials', 'show_playground',
+         'create_playground_panel'),
+        ('🗂️', 'Schema Explorer', 'Visual schema exploration and navigation', 'show_schema_explorer',
+         'create_schema_explorer_panel'),
+        ('📊', 'Performance Dashboard', 'Real-time performance monitoring and alerts', 'show_performance_dashboard',
+         'create_performance_dashboard_panel'),
+        ('📋', 'Documentation', 'Generate documentation', 'show_documentation', 'create_documentation_panel'),
+        ('🔍', 'Search & Filter', 'Search and filter objects', 'show_search', 'create_search_panel'),
+        ('🔄', 'Schema Compare', 'Compare database schemas', 'show_comparison', 'create_comparison_panel'),
+        ('🌐', 'Dependencies', 'Visualize dependencies', 'show_visualization', 'create_visualization_panel'),
+        ('⏰', 'Scheduler', 'Automated tasks and monitoring', 'show_scheduler', 'create_scheduler_panel'),
+        ('📁', 'Projects', 'Multi-database projects', 'show_projects', 'create_projects_panel'),
+        ('🔗', 'API Integration', 'API and webhook settings', 'show_api', None),
+        ('📊', 'Analytics', 'Reports and analytics', 'show_analytics', None),
+        ('🔄', 'Migration', 'Database migration planning', 'show_migration', None),
+        ('🔒', 'Compliance', 'Security and compliance', 'show_compliance', None),
+        ('⚙️', 'Settings', 'Application settings', 'show_settings', 'create_settings_panel'),
+    )
+    
+    # View keys derived from the titles once, at class creation
+    NAV_KEYS = tuple(title.lower().replace(' ', '_') for _, title, _, _, _ in NAV_ITEMS)
+    
+    # Lazily imported modules loaded in the background once the window is up,
+    # so the first connection test or schema load does not pay for them
+    PREWARM_MODULES = ('db_connection', 'documentation_extractor', 'schema_comparison')
+    
+    # Tk variables are created on first access so that views which are
+    # never opened do not allocate their Tcl variables; the connection and
+    # documentation variables are read by worker threads, so setup_variables
+    # creates those up front on the Tk thread (see WORKER_TK_VARS)
+    # Connection variables
+    connection_method = _LazyTkVar(tk.StringVar, "credentials")
+    server = _LazyTkVar(tk.StringVar, "eds-sqlserver.eastus2.cloudapp.azure.com")
+    database = _LazyTkVar(tk.StringVar, "master")
+    username = _LazyTkVar(tk.StringVar, "EDSAdmin")
+    password = _LazyTkVar(tk.StringVar, "")
+    connection_string = _LazyTkVar(tk.StringVar, "")
+    driver = _LazyTkVar(tk.StringVar, "ODBC Driver 17 for SQL Server")
+    client_id = _LazyTkVar(tk.StringVar, "")
+    client_secret = _LazyTkVar(tk.StringVar, "")
+    tenant_id = _LazyTkVar(tk.StringVar, "")
+    
+    # Documentation variables
+    output_dir = _LazyTkVar(tk.StringVar, "output")
+    generate_html = _LazyTkVar(tk.BooleanVar, True)
+    generate_markdown = _LazyTkVar(tk.BooleanVar, True)
+    generate_json = _LazyTkVar(tk.BooleanVar, False)
+    
+    # Status variables
+    status_text = _LazyTkVar(tk.StringVar, "Ready")
+    progress_value = _LazyTkVar(tk.IntVar, 0)
+    current_step = _LazyTkVar(tk.StringVar, "")
+    detailed_progress = _LazyTkVar(tk.StringVar, "")
+    estimated_time = _LazyTkVar(tk.StringVar, "")
+    
+    # UI state variables
+    sidebar_collapsed = _LazyTkVar(tk.BooleanVar, False)
+    theme_var = _LazyTkVar(tk.StringVar, "light")
+    
+    # Search and filter variables
+    search_query = _LazyTkVar(tk.StringVar, "")
+    filter_type = _LazyTkVar(tk.StringVar, "all")
+    
+    # API and monitoring variables
+    api_server_running = _LazyTkVar(tk.BooleanVar, False)
+    api_port = _LazyTkVar(tk.IntVar, 8080)
+    webhook_notifications_enabled = _LazyTkVar(tk.BooleanVar, False)
+    platform_integrations_enabled = _LazyTkVar(tk.BooleanVar, False)
+    
+    WORKER_TK_VARS = ('connection_method', 'server', 'database', 'username', 'password',
+                      'connection_string', 'driver', 'client_id', 'client_secret', 'tenant_id',
+                      'output_dir', 'generate_html', 'generate_markdown', 'generate_json')
+    
     def __init__(self):
         self.root = tk.Tk()
         
@@ -85,6 +229,20 @@ class ModernDatabaseDocumentationGUI:
         self.load_initial_config()
         self.bind_keyboard_shortcuts()
         
+        # Warm the lazily imported modules the first connection will need
+        self.root.after(1000, self._prewarm_imports)
+        
+    def _prewarm_imports(self):
+        """Import PREWARM_MODULES on a background thread after startup."""
+        def worker():
+            for module_name in self.PREWARM_MODULES:
+                try:
+                    importlib.import_module(module_name)
+                except Exception as e:
+                    logger.debug(f"Background import of {module_name} failed: {e}")
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
     def setup_window(self):
         """Configure the main window with modern styling."""
         self.root.title("Azure SQL Database Documentation Generator")
@@ -118,23 +276,8 @@ class ModernDatabaseDocumentationGUI:
         # Phase 2: Workspace Manager
         self.workspace_manager = WorkspaceManager(self.user_preferences)
         
-        # Phase 2: Advanced Search System
-        self.search_system = AdvancedSearchSystem(self.user_preferences)
-        
-        # Phase 2: Data Visualization System
-        self.visualization_system = DataVisualizationSystem(self.user_preferences, self.theme_manager)
-        
-        # Phase 3: Enterprise Project Manager
-        self.enterprise_projects = EnterpriseProjectManager(self.user_preferences)
-        
-        # Phase 3: Intelligent API Integration
-        self.api_integration = IntelligentAPIIntegration(self.user_preferences, self.enterprise_projects)
-        
-        # Phase 3: Advanced Analytics Engine
-        self.analytics_engine = AdvancedAnalyticsEngine(self.user_preferences, self.enterprise_projects)
-        
-        # Phase 3: Smart Security Auditor
-        self.security_auditor = SmartSecurityAuditor(self.user_preferences)
+        # Phase 2/3 search, visualization and enterprise systems are built
+        # on first use (see the cached properties below)
         
         # Phase 1: Smart Loading System
         self.smart_loading = SmartLoadingSystem(self.root, self.theme_manager)
@@ -178,6 +321,8 @@ class ModernDatabaseDocumentationGUI:
     
     def setup_preference_callbacks(self):
         """Setup callbacks for real-time preference updates."""
+        self._debounce_jobs = {}
+        
         # Theme change callback
         def on_theme_change(old_value, new_value):
             try:
@@ -206,10 +351,14 @@ class ModernDatabaseDocumentationGUI:
                 self.error_handler.handle_error(e, "Layout Change",
                     "Failed to change sidebar position.")
         
-        # Register callbacks with user preferences system
-        self.user_preferences.register_callback('appearance', 'theme', on_theme_change)
-        self.user_preferences.register_callback('appearance', 'ui_scale', on_ui_scale_change)
-        self.user_preferences.register_callback('layout', 'sidebar_position', on_sidebar_position_change)
+        # Register callbacks with user preferences system; bursts of changes
+        # (e.g. dragging a slider) are coalesced into one trailing update
+        self.user_preferences.register_callback('appearance', 'theme',
+                                                self._debounce('appearance.theme', on_theme_change))
+        self.user_preferences.register_callback('appearance', 'ui_scale',
+                                                self._debounce('appearance.ui_scale', on_ui_scale_change))
+        self.user_preferences.register_callback('layout', 'sidebar_position',
+                                                self._debounce('layout.sidebar_position', on_sidebar_position_change))
         
         # Load and restore last workspace if enabled
         if self.user_preferences.get_preference('workspace', 'auto_restore_workspace', True):
@@ -220,18 +369,65 @@ class ModernDatabaseDocumentationGUI:
                     self.enhanced_status.update_status(f"Restored workspace: {last_workspace}")
             except Exception as e:
                 print(f"Could not restore last workspace: {e}")
-        
-        # Phase 3: Setup enterprise feature integration
-        self._setup_phase3_integration()
+    
+    def _debounce(self, key: str, callback, delay: int = 100):
+        """Wrap a preference callback so only the last change in a burst runs."""
+        def debounced(old_value, new_value):
+            pending = self._debounce_jobs.pop(key, None)
+            if pending is not None:
+                self.root.after_cancel(pending)
+            self._debounce_jobs[key] = self.root.after(delay, self._run_debounced,
+                                                       key, callback, old_value, new_value)
+        return debounced
+    
+    def _run_debounced(self, key: str, callback, old_value, new_value):
+        """Run a debounced preference callback."""
+        self._debounce_jobs.pop(key, None)
+        callback(old_value, new_value)
+    
+    @_cached_property
+    def search_system(self):
+        """Phase 2: Advanced Search System."""
+        return AdvancedSearchSystem(self.user_preferences)
+    
+    @_cached_property
+    def visualization_system(self):
+        """Phase 2: Data Visualization System."""
+        return DataVisualizationSystem(self.user_preferences, self.theme_manager)
+    
+    @_cached_property
+    def enterprise_projects(self):
+        """Phase 3: Enterprise Project Manager."""
+        enterprise_projects = EnterpriseProjectManager(self.user_preferences)
+        
+        # Register project callbacks for analytics tracking
+        enterprise_projects.register_callback('project_created', self._on_project_created)
+        enterprise_projects.register_callback('project_switched', self._on_project_switched)
+        enterprise_projects.register_callback('database_added', self._on_database_added)
+        
+        # Phase 3 integration needs the analytics engine, which is built on top of this
+        # manager, so run it once the property has cached the manager
+        self.root.after_idle(self._setup_phase3_integration)
+        return enterprise_projects
+    
+    @_cached_property
+    def api_integration(self):
+        """Phase 3: Intelligent API Integration."""
+        return IntelligentAPIIntegration(self.user_preferences, self.enterprise_projects)
+    
+    @_cached_property
+    def analytics_engine(self):
+        """Phase 3: Advanced Analytics Engine."""
+        return AdvancedAnalyticsEngine(self.user_preferences, self.enterprise_projects)
+    
+    @_cached_property
+    def security_auditor(self):
+        """Phase 3: Smart Security Auditor."""
+        return SmartSecurityAuditor(self.user_preferences)
     
     def _setup_phase3_integration(self):
         """Setup Phase 3 enterprise features integration."""
         try:
-            # Register project callbacks for analytics tracking
-            self.enterprise_projects.register_callback('project_created', self._on_project_created)
-            self.enterprise_projects.register_callback('project_switched', self._on_project_switched)
-            self.enterprise_projects.register_callback('database_added', self._on_database_added)
-            
             # Track application startup analytics
             self.analytics_engine.track_activity('application_startup', {
                 'version': '3.0',
@@ -252,10 +448,29 @@ class ModernDatabaseDocumentationGUI:
         except Exception as e:
             print(f"[Phase 3] Error setting up enterprise integration: {e}")
     
+    def _queue_project_event(self, activity_type: str, project_id: str, status_message: str):
+        """Buffer a project event; events are flushed together every 33 ms."""
+        self._event_ring.append((activity_type, project_id, status_message))
+        if self._event_flush_job is None:
+            self._event_flush_job = self.root.after(33, self._flush_events)
+    
+    def _flush_events(self):
+        """Record buffered project events and show only the latest status."""
+        self._event_flush_job = None
+        events = list(self._event_ring)
+        self._event_ring.clear()
+        if not events:
+            return
+        
+        self.analytics_engine.track_activity_batch(
+            [(activity_type, {'project_id': project_id}, None)
+             for activity_type, project_id, _ in events])
+        self.enhanced_status.update_status(events[-1][2])
+    
     def _on_project_created(self, project_id: str):
         """Handle project creation event."""
-        self.analytics_engine.track_activity('project_created', {'project_id': project_id})
-        self.enhanced_status.update_status(f"New project created: {project_id[:8]}...")
+        self._queue_project_event('project_created', project_id,
+                                  f"New project created: {project_id[:8]}...")
         
         # Trigger webhook
         self.api_integration.trigger_webhook('project_created', {
@@ -266,44 +481,19 @@ class ModernDatabaseDocumentationGUI:
     
     def _on_project_switched(self, project_id: str):
         """Handle project switch event."""
-        self.analytics_engine.track_activity('project_switched', {'project_id': project_id})
-        self.enhanced_status.update_status(f"Switched to project: {project_id[:8]}...")
+        self._queue_project_event('project_switched', project_id,
+                                  f"Switched to project: {project_id[:8]}...")
     
     def _on_database_added(self, project_id: str):
         """Handle database addition event."""
-        self.analytics_engine.track_activity('database_added', {'project_id': project_id})
-        self.enhanced_status.update_status("Database added to project")
+        self._queue_project_event('database_added', project_id, "Database added to project")
     
     def setup_variables(self):
-        """Initialize tkinter variables."""
-        # Connection variables
-        self.connection_method = tk.StringVar(value="credentials")
-        self.server = tk.StringVar(value="eds-sqlserver.eastus2.cloudapp.azure.com")
-        self.database = tk.StringVar(value="master")
-        self.username = tk.StringVar(value="EDSAdmin")
-        self.password = tk.StringVar(value="")
-        self.connection_string = tk.StringVar(value="")
-        self.driver = tk.StringVar(value="ODBC Driver 17 for SQL Server")
-        self.client_id = tk.StringVar(value="")
-        self.client_secret = tk.StringVar(value="")
-        self.tenant_id = tk.StringVar(value="")
-        
-        # Documentation variables
-        self.output_dir = tk.StringVar(value="output")
-        self.generate_html = tk.BooleanVar(value=True)
-        self.generate_markdown = tk.BooleanVar(value=True)
-        self.generate_json = tk.BooleanVar(value=False)
-        
-        # Status variables
-        self.status_text = tk.StringVar(value="Ready")
-        self.progress_value = tk.IntVar(value=0)
-        self.current_step = tk.StringVar(value="")
-        self.detailed_progress = tk.StringVar(value="")
-        self.estimated_time = tk.StringVar(value="")
-        
-        # UI state variables
-        self.sidebar_collapsed = tk.BooleanVar(value=False)
-        self.theme_var = tk.StringVar(value="light")
+        """Initialize application state; Tk variables are declared on the class."""
+        # Tcl variables must not be created off the Tk thread, so make the ones
+        # worker threads read before any worker can be the first to touch them
+        for name in self.WORKER_TK_VARS:
+            getattr(self, name)
         
         # Generation control
         self.generation_cancelled = False
@@ -315,33 +505,30 @@ class ModernDatabaseDocumentationGUI:
         self.available_databases = []
         self.selected_databases = []
         
-        # Search and filter variables
-        self.search_query = tk.StringVar(value="")
-        self.filter_type = tk.StringVar(value="all")
-        
-        # API and monitoring variables
-        self.api_server_running = tk.BooleanVar(value=False)
-        self.api_port = tk.IntVar(value=8080)
-        self.webhook_notifications_enabled = tk.BooleanVar(value=False)
-        self.platform_integrations_enabled = tk.BooleanVar(value=False)
-    
+        # Project events waiting for the next _flush_events tick
+        self._event_ring = deque(maxlen=256)
+        self._event_flush_job = None
+
     def setup_logging(self):
         """Setup enhanced logging with UI integration."""
         self.log_handler = LogHandler()
         
+        # Loggers only enqueue records; a listener thread writes them to the
+        # log file and the UI handler so callers never wait on disk I/O
+        self._log_queue = queue.SimpleQueue()
+        self._log_listener = QueueListener(
+            self._log_queue,
+            logging.FileHandler('database_docs.log', encoding='utf-8'),
+            self.log_handler
+        )
+        
         # Configure logging
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('database_docs.log', encoding='utf-8'),
-                self.log_handler
-            ]
+            handlers=[QueueHandler(self._log_queue)]
         )
-        
-        # Add handler to root logger
-        root_logger = logging.getLogger()
-        root_logger.addHandler(self.log_handler)
+        self._log_listener.start()
     
     def setup_profile_manager(self):
         """Setup connection profile manager and other managers."""
@@ -359,12 +546,6 @@ class ModernDatabaseDocumentationGUI:
         
         # Initialize managers
         self.project_manager = ProjectManager()
-        self.webhook_manager = WebhookManager()
-        self.api_server = APIServer(self.api_port.get())
-        self.platform_integration = PlatformIntegration()
-        self.reporting_dashboard = ReportingDashboard(self)
-        self.migration_planner = MigrationPlannerGUI(self)
-        self.compliance_auditor = ComplianceAuditorGUI(self)
         
         # Initialize object details manager (will be set after window creation)
         self.object_details_manager = None
@@ -376,6 +557,39 @@ class ModernDatabaseDocumentationGUI:
             logger.error(f"Failed to initialize project manager: {e}")
             self.project_manager = None
     
+    # Integration and enterprise subsystems are built on first use so that
+    # their modules (and e.g. matplotlib/pandas) stay out of startup.
+    @_cached_property
+    def webhook_manager(self):
+        from api_integration import WebhookManager
+        return WebhookManager()
+    
+    @_cached_property
+    def api_server(self):
+        from api_integration import APIServer
+        # The settings view swaps api_port for a StringVar
+        return APIServer(int(self.api_port.get()))
+    
+    @_cached_property
+    def platform_integration(self):
+        from api_integration import PlatformIntegration
+        return PlatformIntegration()
+    
+    @_cached_property
+    def reporting_dashboard(self):
+        from reporting_analytics import ReportingDashboard
+        return ReportingDashboard(self)
+    
+    @_cached_property
+    def migration_planner(self):
+        from migration_planner import MigrationPlannerGUI
+        return MigrationPlannerGUI(self)
+    
+    @_cached_property
+    def compliance_auditor(self):
+        from compliance_auditor import ComplianceAuditorGUI
+        return ComplianceAuditorGUI(self)
+    
     def setup_application_shortcuts(self):
         """Setup application-wide keyboard shortcuts for Phase 1."""
         # Global shortcuts
@@ -453,28 +667,8 @@ class ModernDatabaseDocumentationGUI:
     
     def add_navigation_items(self):
         """Add items to sidebar navigation."""
-        nav_items = [
-            ('🏠', 'Dashboard', 'Overview and quick actions', self.show_dashboard),
-            ('🔌', 'Connection', 'Database connection settings', self.show_connection),
-            ('🗄️', 'Databases', 'Available databases', self.show_databases),
-            ('🎮', 'Playground', 'Interactive query builder and tutorials', self.show_playground),
-            ('🗂️', 'Schema Explorer', 'Visual schema exploration and navigation', self.show_schema_explorer),
-            ('📊', 'Performance Dashboard', 'Real-time performance monitoring and alerts', self.show_performance_dashboard),
-            ('📋', 'Documentation', 'Generate documentation', self.show_documentation),
-            ('🔍', 'Search & Filter', 'Search and filter objects', self.show_search),
-            ('🔄', 'Schema Compare', 'Compare database schemas', self.show_comparison),
-            ('🌐', 'Dependencies', 'Visualize dependencies', self.show_visualization),
-            ('⏰', 'Scheduler', 'Automated tasks and monitoring', self.show_scheduler),
-            ('📁', 'Projects', 'Multi-database projects', self.show_projects),
-            ('🔗', 'API Integration', 'API and webhook settings', self.show_api),
-            ('📊', 'Analytics', 'Reports and analytics', self.show_analytics),
-            ('🔄', 'Migration', 'Database migration planning', self.show_migration),
-            ('🔒', 'Compliance', 'Security and compliance', self.show_compliance),
-            ('⚙️', 'Settings', 'Application settings', self.show_settings)
-        ]
-        
-        for icon, title, description, callback in nav_items:
-            self.sidebar.add_navigation_item(icon, title, description, callback, title.lower().replace(' ', '_'))
+        for (icon, title, description, callback_name, _), key in zip(self.NAV_ITEMS, self.NAV_KEYS):
+            self.sidebar.add_navigation_item(icon, title, description, getattr(self, callback_name), key)
     
     def create_scrollable_panel(self):
         """Create a scrollable panel for content."""
@@ -485,50 +679,26 @@ class ModernDatabaseDocumentationGUI:
         return scrollable.get_frame()
     
     def create_content_panels(self):
-        """Create all content panels."""
+        """Create the dashboard and register factories for the other panels."""
         # Dashboard
         self.dashboard = DashboardHome(self.content_area, self.theme_manager, self.status_manager)
         self.content_widgets['dashboard'] = self.dashboard.create_dashboard(self.content_area)
         
-        # Connection panel
-        self.content_widgets['connection'] = self.create_connection_panel()
-        
-        # Database list panel
-        self.content_widgets['databases'] = self.create_databases_panel()
-        
-        # Playground panel
-        self.content_widgets['playground'] = self.create_playground_panel()
-        
-        # Schema Explorer panel
-        self.content_widgets['schema_explorer'] = self.create_schema_explorer_panel()
-        
-        # Performance Dashboard panel
-        self.content_widgets['performance_dashboard'] = self.create_performance_dashboard_panel()
-        
-        # Documentation panel
-        self.content_widgets['documentation'] = self.create_documentation_panel()
-        
-        # Search panel
-        self.content_widgets['search_&_filter'] = self.create_search_panel()
-        
-        # Comparison panel
-        self.content_widgets['schema_compare'] = self.create_comparison_panel()
-        
-        # Visualization panel
-        self.content_widgets['dependencies'] = self.create_visualization_panel()
-        
-        # Scheduler panel
-        self.content_widgets['scheduler'] = self.create_scheduler_panel()
-        
-        # Projects panel
-        self.content_widgets['projects'] = self.create_projects_panel()
-        
-        # Settings panel
-        self.content_widgets['settings'] = self.create_settings_panel()
-        
-        # Hide all panels initially
-        for widget in self.content_widgets.values():
-            widget.pack_forget()
+        # Other panels are built the first time show_view asks for them
+        self._panel_factories = {
+            key: getattr(self, factory_name)
+            for key, (*_, factory_name) in zip(self.NAV_KEYS, self.NAV_ITEMS)
+            if factory_name
+        }
+    
+    def _ensure_panel(self, view_name: str) -> Optional[ttk.Frame]:
+        """Return the panel for a view, creating it on first request."""
+        panel = self.content_widgets.get(view_name)
+        if panel is None and view_name in self._panel_factories:
+            panel = self._panel_factories[view_name]()
+            panel.pack_forget()
+            self.content_widgets[view_name] = panel
+        return panel
     
     def create_connection_panel(self) -> ttk.Frame:
         """Create modern connection configuration panel."""
@@ -606,69 +776,97 @@ class ModernDatabaseDocumentationGUI:
         recent_frame = ttk.LabelFrame(parent, text="🕒 Recent Connections", padding="10")
         recent_frame.pack(fill='x', pady=(20, 0))
         
-        # Create a scrollable frame for recent connections
-        canvas = tk.Canvas(recent_frame, height=120)
+        # Rows are drawn straight onto one canvas rather than built from a
+        # frame, two labels, a button and a separator per connection
+        canvas = tk.Canvas(recent_frame, height=120, highlightthickness=0,
+                           background=self.theme_manager.get_color('surface'))
         scrollbar = ttk.Scrollbar(recent_frame, orient="vertical", command=canvas.yview)
-        scrollable_recent = ttk.Frame(canvas)
-        
-        # Configure scrolling
-        scrollable_recent.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_recent, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
+        text_color = self.theme_manager.get_color('text')
+        muted_color = self.theme_manager.get_color('text_secondary')
+        
         # Load and display recent connections
         try:
             recent_connections = self.profile_manager.get_recent_connections(limit=5)
+            self._recent_conns = tuple(recent_connections)
             
             if recent_connections:
+                row_height = 30
                 for i, conn in enumerate(recent_connections):
-                    conn_frame = ttk.Frame(scrollable_recent)
-                    conn_frame.pack(fill='x', padx=5, pady=2)
+                    top = i * row_height
+                    middle = top + row_height // 2
+                    row_tag = f"conn_{i}"
                     
                     # Connection info
                     info_text = f"📊 {conn.get('database', 'N/A')} @ {conn.get('server', 'N/A')}"
                     if len(info_text) > 50:
                         info_text = info_text[:47] + "..."
-                    
-                    info_label = ttk.Label(conn_frame, text=info_text, width=40)
-                    info_label.pack(side='left')
+                    canvas.create_text(10, middle, text=info_text, anchor='w',
+                                       fill=text_color, font=('Inter', 9), tags='recent_text')
                     
                     # Method badge
                     method_text = conn.get('method', 'Unknown').upper()
-                    method_label = ttk.Label(conn_frame, text=method_text, style='Status.TLabel')
-                    method_label.pack(side='left', padx=(10, 5))
+                    canvas.create_text(320, middle, text=method_text, anchor='w',
+                                       fill=muted_color, font=('Inter', 8), tags='recent_muted')
                     
                     # Quick connect button
-                    connect_btn = ttk.Button(conn_frame, text="Connect", width=8,
-                                           command=lambda c=conn: self.load_recent_connection(c))
-                    connect_btn.pack(side='right')
+                    canvas.create_rectangle(440, top + 4, 510, top + row_height - 4,
+                                            fill=self.theme_manager.get_color('accent'),
+                                            outline='', tags=('conn', row_tag, 'recent_button'))
+                    canvas.create_text(475, middle, text="Connect", fill='#ffffff',
+                                       font=('Inter', 9), tags=('conn', row_tag))
                     
                     # Add separator (except for last item)
                     if i < len(recent_connections) - 1:
-                        sep = ttk.Separator(scrollable_recent, orient='horizontal')
-                        sep.pack(fill='x', padx=5, pady=2)
+                        canvas.create_line(5, top + row_height, 515, top + row_height,
+                                           fill=self.theme_manager.get_color('border'),
+                                           tags='recent_sep')
+                
+                # One binding serves every row's Connect button
+                canvas.tag_bind('conn', '<Button-1>', self._on_recent_click)
             else:
                 # No recent connections message
-                no_recent_label = ttk.Label(scrollable_recent, 
-                                          text="No recent connections found.\nSuccessful connections will appear here.", 
-                                          style='Status.TLabel', justify='center')
-                no_recent_label.pack(expand=True, fill='both', padx=20, pady=20)
+                canvas.create_text(20, 20, anchor='nw', fill=muted_color, font=('Inter', 9),
+                                   tags='recent_muted',
+                                   text="No recent connections found.\nSuccessful connections will appear here.")
                 
         except Exception as e:
             # Error loading recent connections
-            error_label = ttk.Label(scrollable_recent, 
-                                  text=f"Error loading recent connections:\n{str(e)}", 
-                                  style='Status.TLabel', justify='center')
-            error_label.pack(expand=True, fill='both', padx=20, pady=20)
+            canvas.create_text(20, 20, anchor='nw', fill=muted_color, font=('Inter', 9),
+                               tags='recent_muted',
+                               text=f"Error loading recent connections:\n{str(e)}")
+        
+        canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        # The items keep the colours they were drawn with, so restyle them on
+        # theme changes; the callback is registered on the first build only
+        if getattr(self, '_recent_canvas', None) is None:
+            self.theme_manager.register_theme_callback(self._restyle_recent_connections)
+        self._recent_canvas = canvas
         
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
+    def _restyle_recent_connections(self, theme_name, theme):
+        """Recolour the recent connections canvas for a newly applied theme."""
+        canvas = self._recent_canvas
+        if not canvas.winfo_exists():
+            return
+        canvas.configure(background=theme.get('surface', '#000000'))
+        for tag, color_name in (('recent_text', 'text'), ('recent_muted', 'text_secondary'),
+                                ('recent_button', 'accent'), ('recent_sep', 'border')):
+            canvas.itemconfigure(tag, fill=theme.get(color_name, '#000000'))
+    
+    def _on_recent_click(self, event):
+        """Load the recent connection whose Connect button was clicked."""
+        canvas = event.widget
+        for tag in canvas.gettags('current'):
+            if tag.startswith('conn_'):
+                self.load_recent_connection(self._recent_conns[int(tag[5:])])
+                break
+    
     def load_recent_connection(self, connection_data):
         """Load a recent connection into the form fields."""
         try:
@@ -957,6 +1155,7 @@ class ModernDatabaseDocumentationGUI:
             
             # Check connection by trying to create one
             try:
+                from db_connection import AzureSQLConnection
                 test_connection = AzureSQLConnection()
                 if not self._test_basic_connection(test_connection):
                     self.add_tree_placeholder("No database connection - please connect first")
@@ -980,6 +1179,7 @@ class ModernDatabaseDocumentationGUI:
         """Background thread for loading database information."""
         try:
             # Create database connection for this operation
+            from db_connection import AzureSQLConnection
             with AzureSQLConnection() as db:
                 if not self._connect_to_database(db):
                     error_msg = "Failed to connect to database"
@@ -1412,6 +1612,7 @@ class ModernDatabaseDocumentationGUI:
                     self.schema_analyzer = SchemaAnalyzer(self.db_connection)
                 
                 # Create playground
+                from database_playground import create_playground_panel
                 self.playground = create_playground_panel(
                     panel, self.db_connection, self.schema_analyzer, self.theme_manager
                 )
@@ -1497,6 +1698,7 @@ class ModernDatabaseDocumentationGUI:
                     self.schema_analyzer = SchemaAnalyzer(self.db_connection)
                 
                 # Create schema explorer
+                from schema_explorer import create_schema_explorer_panel
                 self.schema_explorer = create_schema_explorer_panel(
                     panel, self.db_connection, self.schema_analyzer, self.theme_manager
                 )
@@ -1584,6 +1786,7 @@ class ModernDatabaseDocumentationGUI:
                     self.schema_analyzer = SchemaAnalyzer(self.db_connection)
                 
                 # Create performance dashboard
+                from performance_dashboard import create_performance_dashboard_panel
                 self.performance_dashboard = create_performance_dashboard_panel(
                     panel, self.db_connection, self.schema_analyzer, 
                     self.theme_manager, self.status_manager
@@ -1893,6 +2096,7 @@ class ModernDatabaseDocumentationGUI:
         scrollbar.pack(side="right", fill="y")
         
         # Initialize comparison data
+        from schema_comparison import SchemaComparator
         self.schema_comparator = SchemaComparator()
         self.comparison_results = None
         self.refresh_comparison_databases()
@@ -2722,6 +2926,7 @@ class ModernDatabaseDocumentationGUI:
         """Generate visualization from schema data."""
         try:
             # Create visualizer
+            from dependency_visualizer import DependencyVisualizer, VisualizationType
             visualizer = DependencyVisualizer()
             
             # Get visualization options
@@ -2905,6 +3110,7 @@ class ModernDatabaseDocumentationGUI:
                 if hasattr(self, 'config_manager') and self.config_manager.current_config:
                     try:
                         config = self.config_manager.current_config['database']
+                        from db_connection import AzureSQLConnection
                         self.current_connection = AzureSQLConnection(config)
                         if not self.current_connection.test_connection():
                             return None
@@ -2916,6 +3122,7 @@ class ModernDatabaseDocumentationGUI:
                 return None
             
             # Extract schema data using DocumentationExtractor
+            from documentation_extractor import DocumentationExtractor
             extractor = DocumentationExtractor(self.current_connection)
             return extractor.extract_complete_documentation()
             
@@ -2961,6 +3168,7 @@ class ModernDatabaseDocumentationGUI:
         
         try:
             # Create visualizer and export
+            from dependency_visualizer import DependencyVisualizer, VisualizationType
             visualizer = DependencyVisualizer()
             
             # Get visualization options
@@ -3406,6 +3614,7 @@ Tips:
                 self.db_connection.connect(database=database_name)
             
             # Create documentation extractor
+            from documentation_extractor import DocumentationExtractor
             extractor = DocumentationExtractor(self.db_connection)
             
             # Extract only the components needed for comparison
@@ -3804,8 +4013,9 @@ Tips:
             self.content_widgets[self.current_view].pack_forget()
         
         # Show new view
-        if view_name in self.content_widgets:
-            self.content_widgets[view_name].pack(fill='both', expand=True)
+        panel = self._ensure_panel(view_name)
+        if panel is not None:
+            panel.pack(fill='both', expand=True)
             self.current_view = view_name
             
             # Update sidebar only if requested (avoid recursion)
@@ -4055,6 +4265,7 @@ Tips:
             
             # Step 3: Authentication test
             self.root.after(0, self.connection_tracker.advance_step)
+            from db_connection import AzureSQLConnection
             with AzureSQLConnection() as db:
                 try:
                     auth_success = self._connect_to_database(db)
@@ -4460,6 +4671,7 @@ Tips:
     def _test_connection_thread(self):
         """Thread function for testing connection."""
         try:
+            from db_connection import AzureSQLConnection
             with AzureSQLConnection() as db:
                 success = self._connect_to_database(db)
                 
@@ -4548,6 +4760,9 @@ Tips:
     
     def connect_database(self):
         """Connect to database."""
+        # The form lives on the connection panel, which may not exist yet
+        self._ensure_panel('connection')
+        
         # Validate form first
         if not self.server_entry.validate() or not self.database_entry.validate():
             self.status_manager.show_toast_notification("Please fix connection form errors", 'error')
@@ -4583,6 +4798,7 @@ Tips:
     def _refresh_database_list_thread(self):
         """Thread function for refreshing database list with detailed information."""
         try:
+            from db_connection import AzureSQLConnection
             with AzureSQLConnection() as db:
                 # Connect to master database to get detailed information
                 method = self.connection_method.get()
@@ -4741,6 +4957,7 @@ Tips:
                 if 'connect' in operation.lower():
                     # Try the actual connection
                     config = self._build_connection_config()
+                    from db_connection import AzureSQLConnection
                     connection = AzureSQLConnection()
                     result = connection.connect(config)
                     if result['success']:
@@ -4758,6 +4975,7 @@ Tips:
         
         for alt_config in alternative_configs:
             try:
+                from db_connection import AzureSQLConnection
                 connection = AzureSQLConnection()
                 result = connection.connect(alt_config)
                 if result['success']:
@@ -5062,6 +5280,7 @@ Tips:
             # Connect to database
             self.root.after(0, lambda: self.status_manager.update_status("🔗 Connecting to database..."))
             
+            from db_connection import AzureSQLConnection
             with AzureSQLConnection() as db:
                 if not self._connect_to_database(db):
                     preview_data['errors'].append("Failed to connect to database")
@@ -5535,13 +5754,16 @@ Tips:
         
         # Clean up resources
         try:
-            if hasattr(self, 'api_server'):
+            if 'api_server' in self.__dict__:
                 # Stop API server if running
                 pass
             
             if hasattr(self, 'job_scheduler'):
                 # Stop scheduler
                 pass
+            
+            # Flush queued log records to their handlers
+            self._log_listener.stop()
         except:
             pass
         
@@ -6490,7 +6712,8 @@ class LogHandler(logging.Handler):
     
     def __init__(self):
         super().__init__()
-        self.log_queue = []
+        # Keep only last 1000 log entries
+        self.log_queue = deque(maxlen=1000)
     
     def emit(self, record):
         """Emit a log record."""
@@ -6501,11 +6724,6 @@ class LogHandler(logging.Handler):
                 'level': record.levelname,
                 'message': msg
             })
-            
-            # Keep only last 1000 log entries
-            if len(self.log_queue) > 1000:
-                self.log_queue = self.log_queue[-1000:]
-                
         except Exception:
             self.handleError(record)
 
@@ -58,6 +58,10 @@ class JobScheduler:
         self.running = False
         self.scheduler_thread = None
         self.monitor_thread = None
+        # Due jobs run on daemon threads so a long job neither holds up the
+        # schedule loop nor blocks interpreter exit; a job still running is not restarted
+        self._running_jobs = set()
+        self._running_jobs_lock = threading.Lock()
         
         # Load configuration
         self.config = self._load_config()
@@ -237,7 +241,16 @@ class JobScheduler:
         schedule_spec = job_config["schedule"]
         
         def job_wrapper():
-            self._execute_job(job_id)
+            if not self.running:
+                self._execute_job(job_id)
+                return
+            with self._running_jobs_lock:
+                if job_id in self._running_jobs:
+                    logger.warning(f"Job still running, skipping this run: {job_id}")
+                    return
+                self._running_jobs.add(job_id)
+            threading.Thread(target=self._run_job_thread, args=(job_id,),
+                             name=f"scheduler-job-{job_id}", daemon=True).start()
         
         # Parse schedule specification
         if schedule_spec == "daily":
@@ -262,6 +275,14 @@ class JobScheduler:
             except Exception as e:
                 logger.error(f"Invalid schedule specification: {schedule_spec}")
     
+    def _run_job_thread(self, job_id: str):
+        """Execute a job on its own thread and release its in-flight slot."""
+        try:
+            self._execute_job(job_id)
+        finally:
+            with self._running_jobs_lock:
+                self._running_jobs.discard(job_id)
+    
     def _execute_job(self, job_id: str):
         """Execute a scheduled job."""
         try:
@@ -380,6 +401,8 @@ class JobScheduler:
         # Clear scheduled jobs
         schedule.clear()
         
+        # Jobs already running finish in the background on their daemon threads
+        
         logger.info("Scheduler stopped")
     
     def _load_and_schedule_jobs(self):
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Test script for Migration Planner functionality
+"""
+
+import sys
+import os
+import tempfile
+from contextlib import contextmanager
+
+# Add the current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from migration_planner import (MigrationDatabase, SchemaAnalyzer, MigrationScriptGenerator, MigrationValidator,
+                               MigrationPlannerGUI, _write_script_file)
+
+
+@contextmanager
+def _temp_database():
+    """Yield a MigrationDatabase backed by a throwaway file, removed afterwards."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = MigrationDatabase(os.path.join(tmp_dir, "migrations_test.db"))
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+def test_migration_database_round_trip():
+    """Plans and executions share one connection and survive re-reads."""
+    print("Testing MigrationDatabase round trip...")
+
+    with _temp_database() as db:
+        plan_id = db.save_migration_plan(
+            "plan_a", "SourceDB", "TargetDB", "First plan",
+            {"operations": [{"type": "create_table"}]}, "low", 5, []
+        )
+        # Saving under the same name updates in place
+        again = db.save_migration_plan(
+            "plan_a", "SourceDB", "TargetDB", "Updated plan",
+            {"operations": []}, "medium", 10, ["plan_0"]
+        )
+        assert again == plan_id
+
+        plans = db.get_migration_plans()
+        assert len(plans) == 1
+        assert plans[0]['description'] == "Updated plan"
+        assert plans[0]['dependencies'] == ["plan_0"]
+        print(f"[OK] Plan saved and updated: id {plan_id}")
+
+        execution_id = db.log_migration_execution(plan_id, "started", "tester")
+        assert execution_id > 0
+        print(f"[OK] Execution logged: id {execution_id}")
+
+
+def test_batch_logging():
+    """Batch APIs write every row in a single call."""
+    print("Testing batch execution and validation logging...")
+
+    with _temp_database() as db:
+        plan_id = db.save_migration_plan("plan_b", "Src", "Tgt", "", {}, "low", 1, [])
+        db.log_executions_batch([(plan_id, "started", "tester", None),
+                                 (plan_id, "completed", "tester", "ok")])
+        db.log_validations_batch(plan_id, [
+            {'type': 'syntax', 'status': 'pass', 'message': 'ok', 'details': {}},
+            {'type': 'impact', 'status': 'warning', 'message': 'large table'},
+        ])
+        with db._conn as conn:
+            executions = conn.execute("SELECT COUNT(*) FROM migration_executions").fetchone()[0]
+            validations = conn.execute("SELECT COUNT(*) FROM migration_validations").fetchone()[0]
+        assert executions == 2
+        assert validations == 2
+        print(f"[OK] Logged {executions} executions and {validations} validations")
+
+
+def test_plan_cache_refresh():
+    """Unchanged plans are served from the cache; saved plans are re-read."""
+    print("Testing migration plan cache...")
+
+    with _temp_database() as db:
+        db.save_migration_plan("plan_c", "Src", "Tgt", "v1", {"step": 1}, "low", 1, [])
+        first = db.get_migration_plans()[0]
+        first['migration_data']['step'] = 99
+        first['description'] = "edited"
+        cached = db.get_migration_plans()[0]
+        assert cached['migration_data'] == {"step": 1} and cached['description'] == "v1"
+        print("[OK] Editing a returned plan left the cache intact")
+
+        db.save_migration_plan("plan_c", "Src", "Tgt", "v2", {"step": 2}, "low", 1, [])
+        second = db.get_migration_plans()[0]
+        assert second['migration_data'] == {"step": 2}
+        assert second['description'] == "v2"
+        print("[OK] Cache reused unchanged plans and refreshed saved ones")
+
+
+def test_bulk_plan_save():
+    """Bulk saves insert new plans and update existing ones by name."""
+    print("Testing bulk migration plan save...")
+
+    with _temp_database() as db:
+        plan_id = db.save_migration_plan("plan_d", "Src", "Tgt", "old", {}, "low", 1, [])
+        db.get_migration_plans()
+
+        def plan(name, description):
+            return {'name': name, 'source_db': "Src", 'target_db': "Tgt", 'description': description,
+                    'migration_data': {'name': name}, 'risk_level': "low",
+                    'estimated_duration': 1, 'dependencies': []}
+
+        db.save_migration_plans_bulk([plan("plan_d", "new"), plan("plan_e", "added")])
+        plans = {p['name']: p for p in db.get_migration_plans()}
+        assert set(plans) == {"plan_d", "plan_e"}
+        assert plans["plan_d"]['id'] == plan_id
+        assert plans["plan_d"]['description'] == "new"
+        assert plans["plan_e"]['migration_data'] == {'name': "plan_e"}
+        print(f"[OK] Bulk saved {len(plans)} plans")
+
+
+def test_schema_differences():
+    """Created, dropped and altered objects are reported in schema order."""
+    print("Testing schema difference analysis...")
+
+    source = {'tables': [
+        {'table_name': 'Users', 'columns': [
+            {'column_name': 'id', 'data_type': 'INT', 'is_nullable': 'NO'},
+            {'column_name': 'name', 'data_type': 'VARCHAR', 'max_length': 50, 'is_nullable': 'YES'},
+            {'column_name': 'legacy', 'data_type': 'INT', 'is_nullable': 'YES'},
+        ]},
+        {'table_name': 'Old', 'columns': []},
+    ]}
+    target = {'tables': [
+        {'table_name': 'Users', 'columns': [
+            {'column_name': 'id', 'data_type': 'INT', 'is_nullable': 'NO'},
+            {'column_name': 'name', 'data_type': 'VARCHAR', 'max_length': 100, 'is_nullable': 'YES'},
+            {'column_name': 'email', 'data_type': 'VARCHAR', 'max_length': 255, 'is_nullable': 'YES'},
+        ]},
+        {'table_name': 'Orders', 'columns': []},
+    ]}
+
+    analyzer = SchemaAnalyzer()
+    differences = analyzer.analyze_schema_differences(source, target)
+    operations = [(op['operation'], op['object_name']) for op in differences['tables']]
+    assert operations == [
+        ('CREATE_TABLE', 'Orders'),
+        ('DROP_TABLE', 'Old'),
+        ('ADD_COLUMN', 'Users.email'),
+        ('DROP_COLUMN', 'Users.legacy'),
+        ('ALTER_COLUMN', 'Users.name'),
+    ]
+    print(f"[OK] Found {len(operations)} table differences")
+
+    # The same schema content is only indexed once
+    assert analyzer._index_for(source) is analyzer._index_for(source)
+    assert analyzer.analyze_schema_differences(source, target) == differences
+    assert len(analyzer._diff_cache) == 1
+    print("[OK] Schema index and differences reused for repeated comparisons")
+
+    # Editing returned operations leaves the cached comparison intact
+    differences['tables'][0]['object_name'] = 'Edited'
+    assert analyzer.analyze_schema_differences(source, target)['tables'][0]['object_name'] == 'Orders'
+
+    # A schema dict edited in place is compared again, not served from the cache
+    target['tables'].pop()
+    rerun = analyzer.analyze_schema_differences(source, target)
+    assert [op['object_name'] for op in rerun['tables']][:1] == ['Old']
+    print("[OK] Cached comparisons are isolated from callers and in-place edits")
+
+
+def test_generate_migration_script():
+    """Forward and rollback SQL come from the operation dispatch tables."""
+    print("Testing migration script generation...")
+
+    operations = [
+        {'operation': 'CREATE_TABLE', 'object_name': 'Orders', 'object_type': 'TABLE',
+         'details': {'table_name': 'Orders', 'columns': [
+             {'column_name': 'id', 'data_type': 'int', 'is_nullable': 'NO'},
+             {'column_name': 'note', 'data_type': 'nvarchar', 'max_length': 200, 'is_nullable': 'YES'},
+         ]},
+         'risk_level': 'low', 'rollback_operation': 'DROP_TABLE'},
+        {'operation': 'CREATE_TRIGGER', 'object_name': 'trg_audit', 'object_type': 'TRIGGER',
+         'details': {}, 'risk_level': 'low', 'rollback_operation': 'DROP_TRIGGER'},
+    ]
+
+    forward, rollback = MigrationScriptGenerator().generate_migration_script(operations)
+    assert "CREATE TABLE [Orders] (\n    [id] INT NOT NULL,\n    [note] NVARCHAR(200)\n);" in forward
+    assert "-- TODO: Implement CREATE_TRIGGER for trg_audit" in forward
+    assert "DROP TABLE [Orders];" in rollback
+    assert "-- TODO: Implement rollback for CREATE_TRIGGER" in rollback
+    # Rollback undoes the last operation first, each step under its own comment
+    assert rollback.splitlines()[1:] == [
+        "-- Rollback CREATE_TRIGGER trg_audit",
+        "-- TODO: Implement rollback for CREATE_TRIGGER",
+        "-- Rollback CREATE_TABLE Orders",
+        "DROP TABLE [Orders];",
+    ]
+    print("[OK] Forward and rollback scripts generated")
+
+
+def test_operation_order_follows_foreign_keys():
+    """Referenced tables are created first and dropped last."""
+    print("Testing foreign key aware operation ordering...")
+
+    def table_op(operation, name):
+        return {'operation': operation, 'object_name': name, 'object_type': 'TABLE',
+                'details': {'table_name': name, 'columns': []}, 'risk_level': 'low',
+                'rollback_operation': 'DROP_TABLE' if operation == 'CREATE_TABLE' else 'CREATE_TABLE'}
+
+    operations = [table_op('CREATE_TABLE', 'A_Orders'), table_op('CREATE_TABLE', 'Z_Customers'),
+                  table_op('DROP_TABLE', 'A_Regions'), table_op('DROP_TABLE', 'Z_Stores')]
+    foreign_keys = [{'foreign_key_table': 'A_Orders', 'referenced_table': 'Z_Customers'},
+                    {'foreign_key_table': 'Z_Stores', 'referenced_table': 'A_Regions'}]
+
+    generator = MigrationScriptGenerator()
+    plain = [op['object_name'] for op in generator._order_operations(operations)]
+    ordered = [op['object_name'] for op in generator._order_operations(operations, foreign_keys)]
+    assert plain == ['A_Orders', 'Z_Customers', 'A_Regions', 'Z_Stores']
+    assert ordered == ['Z_Customers', 'A_Orders', 'Z_Stores', 'A_Regions']
+    print(f"[OK] Dependency order: {ordered}")
+
+    # Operations ordered once can be handed to the generator as they are
+    presorted = generator._order_operations(operations, foreign_keys)
+    forward, rollback = generator.generate_migration_script(presorted, presorted=True)
+    expected_forward, expected_rollback = generator.generate_migration_script(operations, foreign_keys)
+    assert forward.splitlines()[1:] == expected_forward.splitlines()[1:]
+    assert rollback.splitlines()[1:] == expected_rollback.splitlines()[1:]
+    print("[OK] Presorted operations produce the same scripts")
+
+
+def test_validate_migration_plan():
+    """Every rule sees the operations from all difference categories."""
+    print("Testing migration plan validation...")
+
+    def op(operation, name):
+        return {'operation': operation, 'object_name': name, 'object_type': 'TABLE',
+                'details': {}, 'risk_level': 'low'}
+
+    plan = {
+        'differences': {
+            'tables': [op('DROP_TABLE', 'Orders'), op('ALTER_TABLE', 'Orders')],
+            'indexes': [op('DROP_INDEX', f'Orders.ix_{i}') for i in range(6)],
+        },
+        'forward_script': "DROP TABLE [Orders];",
+        'rollback_script': "",
+    }
+    validator = MigrationValidator()
+    results = validator.validate_migration_plan(plan)
+    messages = [r['message'] for r in results]
+    # The DROP_INDEX operations live in another category but still count for Orders
+    dependency = [r for r in results if r['type'] == 'dependency']
+    assert [r['details'] for r in dependency] == [{'table': 'Orders'}]
+    assert any(m.startswith("Migration drops 6 indexes") for m in messages)
+    print(f"[OK] Validation produced {len(results)} results")
+
+    # Revalidating reuses the syntax scan until the script changes
+    assert validator.validate_migration_plan(plan) == results
+    plan['forward_script'] = "DROP TABLE [Orders]"
+    rerun = [r['message'] for r in validator.validate_migration_plan(plan)]
+    assert any("DROP TABLE [Orders]" in m for m in rerun)
+    print("[OK] Syntax results refreshed after the script changed")
+
+    empty = validator.validate_migration_plan({'differences': {'tables': []}})
+    assert [(r['type'], r['message']) for r in empty] == [('noop', "Nothing to validate")]
+    print("[OK] Empty plan skipped the validation rules")
+
+
+def test_syntax_check_long_single_line():
+    """A multi-megabyte script on one line counts as a single statement line."""
+    print("Testing syntax check on a long single-line script...")
+
+    line = "DROP TABLE x; CREATE TABLE y (a int); SELECT 1; " * 56000
+    script = line + "\nALTER TABLE z ADD b int"
+    validator = MigrationValidator()
+    statements = list(validator._statement_lines(script))
+    assert statements == [(0, line.strip()), (len(line) + 1, "ALTER TABLE z ADD b int")]
+    issues = validator._check_basic_syntax(script)
+    assert issues == ["Line 2 may be missing semicolon: ALTER TABLE z ADD b int..."]
+    print(f"[OK] Checked {len(script) // 1024} KB: {len(statements)} statement lines, {len(issues)} warning")
+
+
+def test_write_script_file():
+    """Exported scripts are written in full, whatever their size."""
+    print("Testing script export...")
+
+    script = "".join(f"-- Step {i} → done\nDROP TABLE [T{i}];\n" for i in range(50000))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "migration.sql")
+        _write_script_file(path, script)
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == script
+    print(f"[OK] Wrote {len(script)} characters")
+
+
+class _FakeWidget:
+    """Stands in for a Tk widget, recording callbacks scheduled with after()."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback, *args):
+        self.scheduled.append((callback.__name__, args))
+
+
+def _planner_without_window():
+    """A MigrationPlannerGUI whose parent, like the host apps, has no after()."""
+    planner = MigrationPlannerGUI.__new__(MigrationPlannerGUI)
+    planner.parent = object()
+    planner.schema_analyzer = SchemaAnalyzer()
+    planner.script_generator = MigrationScriptGenerator()
+    planner.validator = MigrationValidator()
+    planner.migration_db = None
+    planner.compare_button = _FakeWidget()
+    planner.validate_button = _FakeWidget()
+    planner.generate_button = _FakeWidget()
+    return planner
+
+
+def test_worker_threads_report_through_widgets():
+    """Worker results reach the UI thread even when parent is not a Tk widget."""
+    print("Testing worker thread callbacks...")
+
+    planner = _planner_without_window()
+    planner._compare_schemas_thread({'tables': [{'table_name': 'Orders', 'columns': []}]},
+                                    {'tables': []}, [])
+    assert [name for name, _ in planner.compare_button.scheduled] == ['_comparison_complete']
+
+    planner._compare_schemas_thread(None, None, [])
+    assert planner.compare_button.scheduled[-1][0] == '_comparison_failed'
+    print("[OK] Comparison results and failures were scheduled")
+
+    plan = {'differences': {'tables': []}, 'forward_script': "", 'rollback_script': ""}
+    planner._validate_migration_plan_thread(plan, None, None)
+    assert [name for name, _ in planner.validate_button.scheduled] == ['_validation_complete']
+
+    planner._validate_migration_plan_thread(None, None, None)
+    assert planner.validate_button.scheduled[-1][0] == '_validation_failed'
+    print("[OK] Validation results and failures were scheduled")
+
+    planner._generate_migration_scripts_thread(plan, [], [])
+    assert [name for name, _ in planner.generate_button.scheduled] == ['_scripts_generated']
+
+    planner._generate_migration_scripts_thread(None, None, [])
+    assert planner.generate_button.scheduled[-1][0] == '_script_generation_failed'
+    print("[OK] Script generation results and failures were scheduled")
+
+
+def main():
+    """Run all tests."""
+    print("Migration Planner Test Suite")
+    print("=" * 50)
+
+    all_passed = True
+    try:
+        test_migration_database_round_trip()
+        test_batch_logging()
+        test_plan_cache_refresh()
+        test_bulk_plan_save()
+        test_schema_differences()
+        test_generate_migration_script()
+        test_operation_order_follows_foreign_keys()
+        test_validate_migration_plan()
+        test_syntax_check_long_single_line()
+        test_write_script_file()
+        test_worker_threads_report_through_widgets()
+    except Exception as e:
+        print(f"[FAIL] MigrationDatabase test failed: {e}")
+        all_passed = False
+
+    print("\n" + "=" * 50)
+    if all_passed:
+        print("All tests passed! Migration Planner is ready.")
+    else:
+        print("Some tests failed. Please check the implementation.")
+
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -162,6 +162,12 @@ class ThemeManager:
         """Configure modern ttk styles with sleek design and improved spacing."""
         style = self.style
         
+        # Several managers share one ttk.Style and startup applies the saved
+        # theme more than once, so remember the colours last configured on
+        # the style itself and skip the Tcl round-trips when nothing changed
+        if getattr(style, '_configured_theme_colors', None) == theme:
+            return
+        
         # Modern base styles with improved spacing
         style.configure('TFrame', 
                        background=theme['background'],
@@ -453,6 +459,8 @@ class ThemeManager:
                        background=theme['surface_elevated'],
                        relief='flat',
                        borderwidth=0)
+        
+        style._configured_theme_colors = dict(theme)
     
     def get_color(self, color_name: str) -> str:
         """Get a color from the current theme."""
@@ -987,6 +995,7 @@ class SidebarNavigation:
         self.theme_manager = theme_manager
         self.active_item = None
         self.navigation_items = []
+        self._items_by_id = {}
         self.callbacks = {}
         
     def create_sidebar(self, parent, width: int = 250) -> ttk.Frame:
@@ -1043,29 +1052,26 @@ class SidebarNavigation:
             widget.configure(cursor='hand2')
         
         # Store item reference
-        self.navigation_items.append({
+        item = {
             'id': item_id,
             'frame': item_frame,
             'callback': callback
-        })
+        }
+        self.navigation_items.append(item)
+        self._items_by_id[item_id] = item
         
         self.callbacks[item_id] = callback
     
     def activate_item(self, item_id: str, callback: Callable = None):
         """Activate a navigation item."""
         # Deactivate current item
-        if self.active_item:
-            for item in self.navigation_items:
-                if item['id'] == self.active_item:
-                    item['frame'].configure(style='SidebarItem.TFrame')
-                    break
+        if self.active_item in self._items_by_id:
+            self._items_by_id[self.active_item]['frame'].configure(style='SidebarItem.TFrame')
         
         # Activate new item
         self.active_item = item_id
-        for item in self.navigation_items:
-            if item['id'] == item_id:
-                item['frame'].configure(style='SidebarItemActive.TFrame')
-                break
+        if item_id in self._items_by_id:
+            self._items_by_id[item_id]['frame'].configure(style='SidebarItemActive.TFrame')
         
         # Execute callback
         if callback:
@@ -4342,6 +4348,23 @@ class AdvancedAnalyticsEngine:
         except Exception as e:
             print(f"Error tracking activity: {e}")
     
+    def track_activity_batch(self, activities: List[tuple]):
+        """Track several (activity_type, details, duration_ms) activities in one commit."""
+        try:
+            import json
+            
+            cursor = self.analytics_db.cursor()
+            cursor.executemany("""
+                INSERT INTO user_activities (activity_type, details, duration_ms)
+                VALUES (?, ?, ?)
+            """, [(activity_type, json.dumps(details or {}), duration_ms)
+                  for activity_type, details, duration_ms in activities])
+            
+            self.analytics_db.commit()
+            
+        except Exception as e:
+            print(f"Error tracking activities: {e}")
+    
     def track_operation(self, operation_type: str, database_name: str,
                        execution_time_ms: int, success: bool, error_message: str = None):
         """Track database operation metrics."""